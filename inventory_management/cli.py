@@ -2,110 +2,268 @@
 Command-line interface for the inventory management system.
 """
 
+import string
 import sys
 from typing import Optional
 from .inventory import InventoryManager
 from .models import Product
 
+# Separators and menu text, built once at import instead of per call
+_SEP40 = "-" * 40
+_SEP50 = "=" * 50
+_TABLE_SEP = "-" * 90
+
+_MENU_TEXT = "\n".join([
+    "",
+    _SEP40,
+    "MAIN MENU",
+    _SEP40,
+    "1.  Add New Product",
+    "2.  View All Products",
+    "3.  View Product Details",
+    "4.  Update Product",
+    "5.  Delete Product",
+    "6.  Add Stock",
+    "7.  Remove Stock (Sale)",
+    "8.  Search Products",
+    "9.  View Low Stock Items",
+    "10. Generate Inventory Report",
+    "11. Backup Data",
+    "12. Exit",
+    _SEP40,
+])
+
+# Table header and row template, formatted once at import so the format
+# spec is not re-parsed from an f-string on every row
+_TABLE_HEADER = f"{'SKU':<10} {'Name':<25} {'Category':<15} {'Price':>10} {'Qty':>8} {'Value':>12} {'Status':<8}"
+_ROW_FMT = "{:<10} {:<25} {:<15} ${:>9.2f} {:>8} ${:>11.2f} {:<8}".format
+
+
+# Sentinel returned by _ask when the input cannot be cast to the
+# requested type (distinct from any legitimate value or default)
+_INVALID = object()
+
+# SKUs are ASCII; a precomputed translate table folds case with a flat
+# C-level lookup instead of the full Unicode casemapping in str.upper()
+_UPPER_TR = str.maketrans(string.ascii_lowercase, string.ascii_uppercase)
+
+
+def _norm_sku(raw: str) -> str:
+    """Normalize a user-entered SKU to its canonical uppercase form.
+
+    The result is interned so repeated lookups against the product dict
+    hit the fast pointer-equality path instead of comparing characters.
+    """
+    return sys.intern(raw.strip().translate(_UPPER_TR))
+
 
 class InventoryCLI:
     """Interactive command-line interface for inventory management."""
     
     def __init__(self, storage_path: str = "inventory_data.json"):
-        """Initialize the CLI with an inventory manager."""
-        self.manager = InventoryManager(storage_path)
-    
+        """Initialize the CLI; the inventory manager is created lazily."""
+        self._storage_path = storage_path
+        self._manager: Optional[InventoryManager] = None
+        # Menu dispatch table: choice -> handler, built once instead of
+        # re-scanning an if/elif chain on every loop iteration
+        self._dispatch = {
+            "1": self._add_product,
+            "2": self._view_all_products,
+            "3": self._view_product,
+            "4": self._update_product,
+            "5": self._delete_product,
+            "6": self._add_stock,
+            "7": self._remove_stock,
+            "8": self._search_products,
+            "9": self._view_low_stock,
+            "10": self._view_report,
+            "11": self._backup_data,
+        }
+        # Batch command table: op name -> handler taking the parsed fields
+        self._batch_ops = {
+            "add": self._batch_add_product,
+            "addstock": self._batch_add_stock,
+            "removestock": self._batch_remove_stock,
+            "delete": self._batch_delete_product,
+        }
+
+    @property
+    def manager(self) -> InventoryManager:
+        """Lazily create the inventory manager on first use.
+
+        Loading and parsing the JSON file is deferred off the startup path,
+        so actions that never touch the catalog (e.g. an immediate exit or
+        a file-level backup) skip it entirely.
+        """
+        if self._manager is None:
+            self._manager = InventoryManager(self._storage_path)
+        return self._manager
+
+    def _prompt(self, prompt: str) -> str:
+        """Prompt for one line of input.
+
+        On a tty this delegates to input() for normal prompt-echo
+        behavior. When stdin is piped, it reads through the buffered
+        sys.stdin.readline instead, which is much faster for scripted
+        bulk input.
+        """
+        if sys.stdin.isatty():
+            return input(prompt)
+        sys.stdout.write(prompt)
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip("\n")
+
+    def _ask(self, prompt: str, cast=str, default=None):
+        """Prompt once, strip once, and cast the result.
+
+        Returns default when the input is empty, or the _INVALID sentinel
+        when the cast rejects the value, so callers branch on the result
+        instead of wrapping every numeric read in its own try/except.
+        """
+        raw = self._prompt(prompt).strip()
+        if not raw:
+            return default
+        if cast is str:
+            return raw
+        try:
+            return cast(raw)
+        except ValueError:
+            return _INVALID
+
+    def _prompt_existing_product(self, prompt: str = "Enter Product SKU: "):
+        """Prompt for a SKU and look it up in one place.
+
+        Returns a (sku, product) tuple; product is None (after printing
+        the not-found message) when no product matches.
+        """
+        sku = _norm_sku(self._prompt(prompt))
+        product = self.manager.get_product(sku)
+
+        if not product:
+            print(f"\n[!] Product with SKU '{sku}' not found.")
+            return sku, None
+
+        return sku, product
+
     def run(self):
         """Run the main CLI loop."""
-        print("\n" + "=" * 50)
+        print("\n" + _SEP50)
         print("  INVENTORY MANAGEMENT SYSTEM")
-        print("=" * 50)
+        print(_SEP50)
         
         while True:
             self._show_menu()
-            choice = input("\nEnter your choice (1-12): ").strip()
+            choice = self._prompt("\nEnter your choice (1-12): ").strip()
             
-            if choice == "1":
-                self._add_product()
-            elif choice == "2":
-                self._view_all_products()
-            elif choice == "3":
-                self._view_product()
-            elif choice == "4":
-                self._update_product()
-            elif choice == "5":
-                self._delete_product()
-            elif choice == "6":
-                self._add_stock()
-            elif choice == "7":
-                self._remove_stock()
-            elif choice == "8":
-                self._search_products()
-            elif choice == "9":
-                self._view_low_stock()
-            elif choice == "10":
-                self._view_report()
-            elif choice == "11":
-                self._backup_data()
+            handler = self._dispatch.get(choice)
+            if handler:
+                handler()
             elif choice == "12":
                 print("\nThank you for using the Inventory Management System!")
                 print("Goodbye!\n")
                 break
             else:
                 print("\n[!] Invalid choice. Please try again.")
-    
+
+    def run_batch(self, ops_iter):
+        """
+        Run a batch of commands without interactive prompts.
+
+        Each item in ops_iter is a CSV-like line:
+            add,name,category,price,quantity[,description[,reorder_level[,supplier[,sku]]]]
+            addstock,sku,quantity
+            removestock,sku,quantity
+            delete,sku
+
+        Saving is deferred until the whole batch has been applied, so bulk
+        imports pay for a single write to disk instead of one per operation.
+        """
+        self.manager.autosave = False
+        try:
+            for line_no, line in enumerate(ops_iter, start=1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+
+                op, _, rest = line.partition(",")
+                handler = self._batch_ops.get(op.strip().lower())
+
+                if not handler:
+                    print(f"[!] Line {line_no}: unknown command '{op}'")
+                    continue
+
+                try:
+                    success, message = handler(rest.split(","))
+                except (ValueError, IndexError):
+                    print(f"[!] Line {line_no}: malformed command: {line}")
+                    continue
+
+                prefix = "[✓]" if success else "[!]"
+                print(f"{prefix} Line {line_no}: {message}")
+        finally:
+            self.manager.autosave = True
+            self.manager.save()
+
+    def _batch_add_product(self, fields):
+        """Add a product from batch fields: name,category,price,quantity[,...]."""
+        return self.manager.add_product(
+            name=fields[0].strip(),
+            category=fields[1].strip(),
+            price=float(fields[2]),
+            quantity=int(fields[3]),
+            description=fields[4].strip() if len(fields) > 4 else "",
+            reorder_level=int(fields[5]) if len(fields) > 5 and fields[5].strip() else 10,
+            supplier=fields[6].strip() if len(fields) > 6 else "",
+            sku=_norm_sku(fields[7]) if len(fields) > 7 and fields[7].strip() else None
+        )
+
+    def _batch_add_stock(self, fields):
+        """Add stock from batch fields: sku,quantity."""
+        return self.manager.add_stock(_norm_sku(fields[0]), int(fields[1]))
+
+    def _batch_remove_stock(self, fields):
+        """Remove stock from batch fields: sku,quantity."""
+        return self.manager.remove_stock(_norm_sku(fields[0]), int(fields[1]))
+
+    def _batch_delete_product(self, fields):
+        """Delete a product from batch fields: sku."""
+        return self.manager.delete_product(_norm_sku(fields[0]))
+
     def _show_menu(self):
         """Display the main menu."""
-        print("\n" + "-" * 40)
-        print("MAIN MENU")
-        print("-" * 40)
-        print("1.  Add New Product")
-        print("2.  View All Products")
-        print("3.  View Product Details")
-        print("4.  Update Product")
-        print("5.  Delete Product")
-        print("6.  Add Stock")
-        print("7.  Remove Stock (Sale)")
-        print("8.  Search Products")
-        print("9.  View Low Stock Items")
-        print("10. Generate Inventory Report")
-        print("11. Backup Data")
-        print("12. Exit")
-        print("-" * 40)
+        print(_MENU_TEXT)
     
     def _add_product(self):
         """Handle adding a new product."""
         print("\n--- Add New Product ---")
         
-        name = input("Product Name: ").strip()
+        name = self._ask("Product Name: ", default="")
         if not name:
             print("[!] Product name cannot be empty.")
             return
-        
-        category = input("Category: ").strip()
+
+        category = self._ask("Category: ", default="")
         if not category:
             print("[!] Category cannot be empty.")
             return
-        
-        try:
-            price = float(input("Price: $").strip())
-            quantity = int(input("Initial Quantity: ").strip())
-        except ValueError:
+
+        price = self._ask("Price: $", float, default=_INVALID)
+        quantity = self._ask("Initial Quantity: ", int, default=_INVALID)
+        if price is _INVALID or quantity is _INVALID:
             print("[!] Invalid number format.")
             return
-        
-        description = input("Description (optional): ").strip()
-        
-        try:
-            reorder_level_input = input("Reorder Level (default: 10): ").strip()
-            reorder_level = int(reorder_level_input) if reorder_level_input else 10
-        except ValueError:
+
+        description = self._ask("Description (optional): ", default="")
+
+        reorder_level = self._ask("Reorder Level (default: 10): ", int, default=10)
+        if reorder_level is _INVALID:
             reorder_level = 10
-        
-        supplier = input("Supplier (optional): ").strip()
-        
-        sku_input = input("Custom SKU (press Enter for auto-generated): ").strip()
-        sku = sku_input if sku_input else None
+
+        supplier = self._ask("Supplier (optional): ", default="")
+
+        sku = self._ask("Custom SKU (press Enter for auto-generated): ")
         
         success, message = self.manager.add_product(
             name=name,
@@ -138,63 +296,52 @@ class InventoryCLI:
         """View details of a specific product."""
         print("\n--- View Product Details ---")
         
-        sku = input("Enter Product SKU: ").strip().upper()
-        product = self.manager.get_product(sku)
-        
-        if not product:
-            print(f"\n[!] Product with SKU '{sku}' not found.")
+        sku, product = self._prompt_existing_product()
+        if product is None:
             return
         
-        print("\n" + "-" * 40)
-        print(f"SKU:           {product.sku}")
-        print(f"Name:          {product.name}")
-        print(f"Category:      {product.category}")
-        print(f"Price:         ${product.price:.2f}")
-        print(f"Quantity:      {product.quantity}")
-        print(f"Description:   {product.description or 'N/A'}")
-        print(f"Reorder Level: {product.reorder_level}")
-        print(f"Supplier:      {product.supplier or 'N/A'}")
-        print(f"Created:       {product.created_at}")
-        print(f"Last Updated:  {product.updated_at}")
-        print(f"Total Value:   ${product.total_value():.2f}")
-        print(f"Stock Status:  {'LOW STOCK!' if product.is_low_stock() else 'OK'}")
-        print("-" * 40)
+        lines = [
+            "",
+            _SEP40,
+            f"SKU:           {product.sku}",
+            f"Name:          {product.name}",
+            f"Category:      {product.category}",
+            f"Price:         ${product.price:.2f}",
+            f"Quantity:      {product.quantity}",
+            f"Description:   {product.description or 'N/A'}",
+            f"Reorder Level: {product.reorder_level}",
+            f"Supplier:      {product.supplier or 'N/A'}",
+            f"Created:       {product.created_at}",
+            f"Last Updated:  {product.updated_at}",
+            f"Total Value:   ${product.total_value():.2f}",
+            f"Stock Status:  {'LOW STOCK!' if product.is_low_stock() else 'OK'}",
+            _SEP40,
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def _update_product(self):
         """Update an existing product."""
         print("\n--- Update Product ---")
         
-        sku = input("Enter Product SKU to update: ").strip().upper()
-        product = self.manager.get_product(sku)
-        
-        if not product:
-            print(f"\n[!] Product with SKU '{sku}' not found.")
+        sku, product = self._prompt_existing_product("Enter Product SKU to update: ")
+        if product is None:
             return
         
         print(f"\nCurrent product: {product.name}")
         print("(Press Enter to keep current value)\n")
         
-        name = input(f"Name [{product.name}]: ").strip() or None
-        category = input(f"Category [{product.category}]: ").strip() or None
-        
-        try:
-            price_input = input(f"Price [${product.price:.2f}]: $").strip()
-            price = float(price_input) if price_input else None
-            
-            qty_input = input(f"Quantity [{product.quantity}]: ").strip()
-            quantity = int(qty_input) if qty_input else None
-            
-            desc_input = input(f"Description [{product.description or 'N/A'}]: ").strip()
-            description = desc_input if desc_input else None
-            
-            reorder_input = input(f"Reorder Level [{product.reorder_level}]: ").strip()
-            reorder_level = int(reorder_input) if reorder_input else None
-        except ValueError:
+        name = self._ask(f"Name [{product.name}]: ")
+        category = self._ask(f"Category [{product.category}]: ")
+        price = self._ask(f"Price [${product.price:.2f}]: $", float)
+        quantity = self._ask(f"Quantity [{product.quantity}]: ", int)
+        description = self._ask(f"Description [{product.description or 'N/A'}]: ")
+        reorder_level = self._ask(f"Reorder Level [{product.reorder_level}]: ", int)
+
+        if _INVALID in (price, quantity, reorder_level):
             print("\n[!] Invalid number format. Update cancelled.")
             return
-        
-        supplier_input = input(f"Supplier [{product.supplier or 'N/A'}]: ").strip()
-        supplier = supplier_input if supplier_input else None
+
+        supplier = self._ask(f"Supplier [{product.supplier or 'N/A'}]: ")
         
         success, message = self.manager.update_product(
             sku=sku,
@@ -216,14 +363,11 @@ class InventoryCLI:
         """Delete a product from inventory."""
         print("\n--- Delete Product ---")
         
-        sku = input("Enter Product SKU to delete: ").strip().upper()
-        product = self.manager.get_product(sku)
-        
-        if not product:
-            print(f"\n[!] Product with SKU '{sku}' not found.")
+        sku, product = self._prompt_existing_product("Enter Product SKU to delete: ")
+        if product is None:
             return
         
-        confirm = input(f"Are you sure you want to delete '{product.name}'? (yes/no): ").strip().lower()
+        confirm = self._prompt(f"Are you sure you want to delete '{product.name}'? (yes/no): ").strip().lower()
         
         if confirm == "yes":
             success, message = self.manager.delete_product(sku)
@@ -238,22 +382,19 @@ class InventoryCLI:
         """Add stock to a product."""
         print("\n--- Add Stock ---")
         
-        sku = input("Enter Product SKU: ").strip().upper()
-        product = self.manager.get_product(sku)
-        
-        if not product:
-            print(f"\n[!] Product with SKU '{sku}' not found.")
+        sku, product = self._prompt_existing_product()
+        if product is None:
             return
         
         print(f"Current stock for '{product.name}': {product.quantity}")
         
-        try:
-            quantity = int(input("Quantity to add: ").strip())
-        except ValueError:
+        quantity = self._ask("Quantity to add: ", int, default=_INVALID)
+        if quantity is _INVALID:
             print("[!] Invalid quantity.")
             return
-        
-        success, message = self.manager.add_stock(sku, quantity)
+
+        # Reuse the product fetched above instead of a second SKU lookup
+        success, message = self.manager.add_stock_to(product, quantity)
         
         if success:
             print(f"\n[✓] {message}")
@@ -264,22 +405,19 @@ class InventoryCLI:
         """Remove stock from a product (for sales)."""
         print("\n--- Remove Stock (Sale) ---")
         
-        sku = input("Enter Product SKU: ").strip().upper()
-        product = self.manager.get_product(sku)
-        
-        if not product:
-            print(f"\n[!] Product with SKU '{sku}' not found.")
+        sku, product = self._prompt_existing_product()
+        if product is None:
             return
         
         print(f"Current stock for '{product.name}': {product.quantity}")
         
-        try:
-            quantity = int(input("Quantity to remove: ").strip())
-        except ValueError:
+        quantity = self._ask("Quantity to remove: ", int, default=_INVALID)
+        if quantity is _INVALID:
             print("[!] Invalid quantity.")
             return
-        
-        success, message = self.manager.remove_stock(sku, quantity)
+
+        # Reuse the product fetched above instead of a second SKU lookup
+        success, message = self.manager.remove_stock_from(product, quantity)
         
         if success:
             print(f"\n[✓] {message}")
@@ -293,19 +431,19 @@ class InventoryCLI:
         print("2. Search by Category")
         print("3. Search by Supplier")
         
-        choice = input("\nSearch option (1-3): ").strip()
+        choice = self._prompt("\nSearch option (1-3): ").strip()
         
         if choice == "1":
-            query = input("Enter name to search: ").strip()
+            query = self._prompt("Enter name to search: ").strip()
             results = self.manager.search_by_name(query)
         elif choice == "2":
             categories = self.manager.get_categories()
             if categories:
                 print(f"Available categories: {', '.join(categories)}")
-            query = input("Enter category: ").strip()
+            query = self._prompt("Enter category: ").strip()
             results = self.manager.search_by_category(query)
         elif choice == "3":
-            query = input("Enter supplier name: ").strip()
+            query = self._prompt("Enter supplier name: ").strip()
             results = self.manager.search_by_supplier(query)
         else:
             print("[!] Invalid search option.")
@@ -332,14 +470,24 @@ class InventoryCLI:
     
     def _view_report(self):
         """Display the inventory report."""
-        print("\n" + self.manager.generate_inventory_report())
+        sys.stdout.write("\n")
+        sys.stdout.writelines(
+            line + "\n" for line in self.manager.generate_inventory_report_lines()
+        )
     
     def _backup_data(self):
         """Create a backup of inventory data."""
         print("\n--- Backup Data ---")
-        
-        success, message = self.manager.backup()
-        
+
+        if self._manager is None:
+            # Manager never loaded: copy the file directly instead of
+            # parsing the whole catalog just to write it back out
+            from .storage import InventoryStorage
+            success = InventoryStorage(self._storage_path).backup()
+            message = "Backup created successfully" if success else "Failed to create backup"
+        else:
+            success, message = self.manager.backup()
+
         if success:
             print(f"[✓] {message}")
         else:
@@ -350,31 +498,40 @@ class InventoryCLI:
         if not products:
             return
         
-        # Header
-        print("-" * 90)
-        print(f"{'SKU':<10} {'Name':<25} {'Category':<15} {'Price':>10} {'Qty':>8} {'Value':>12} {'Status':<8}")
-        print("-" * 90)
-        
-        # Rows
+        # Build the whole table in memory and emit it with a single write,
+        # instead of one print (and potential flush) per row
+        lines = [_TABLE_SEP, _TABLE_HEADER, _TABLE_SEP]
+
         for p in products:
-            status = "LOW" if p.is_low_stock() else "OK"
-            print(f"{p.sku:<10} {p.name[:24]:<25} {p.category[:14]:<15} "
-                  f"${p.price:>9.2f} {p.quantity:>8} ${p.total_value():>11.2f} {status:<8}")
-        
-        print("-" * 90)
-        print(f"Total: {len(products)} products")
+            # Compute derived values once as locals rather than paying a
+            # method call per column on every row
+            quantity = p.quantity
+            total_value = p.price * quantity
+            status = "LOW" if quantity <= p.reorder_level else "OK"
+            lines.append(_ROW_FMT(p.sku, p.display_name, p.display_category,
+                                  p.price, quantity, total_value, status))
+
+        lines.append(_TABLE_SEP)
+        lines.append(f"Total: {len(products)} products")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
     """Entry point for the CLI application."""
-    storage_path = "inventory_data.json"
-    
+    args = sys.argv[1:]
+
+    # Check if batch mode is requested (commands piped via stdin)
+    batch_mode = '--batch' in args
+    args = [arg for arg in args if arg != '--batch']
+
     # Check for custom storage path in command line args
-    if len(sys.argv) > 1:
-        storage_path = sys.argv[1]
-    
+    storage_path = args[0] if args else "inventory_data.json"
+
     cli = InventoryCLI(storage_path)
-    cli.run()
+    if batch_mode:
+        cli.run_batch(sys.stdin)
+    else:
+        cli.run()
 
 
 if __name__ == "__main__":
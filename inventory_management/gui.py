@@ -2,14 +2,78 @@
 Graphical User Interface for the inventory management system using customtkinter.
 """
 
+import copy
+
 import customtkinter as ctk
-from tkinter import messagebox
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import islice
+from tkinter import messagebox, ttk
 from typing import Optional
 from .inventory import InventoryManager
 from .models import Product
 
 # Constants
-MAX_LOW_STOCK_DISPLAY = 10  # Maximum number of low stock items to display in popup
+REPORT_CHUNK_SIZE = 4096  # Characters inserted into the report textbox per event-loop pass
+REPORT_LINES_PER_TICK = 200  # Report lines consumed from the generator per event-loop pass
+PRODUCT_CHUNK_SIZE = 200  # Table rows inserted per event-loop pass during a rebuild
+
+# Rendered once at import; the year cannot change within a session
+_ABOUT_TEXT = f"""
+Inventory Management System
+Version 1.0
+
+A comprehensive inventory management application
+with CLI and GUI interfaces.
+
+Features:
+• Product Management (CRUD operations)
+• Stock Tracking
+• Search & Filter
+• Low Stock Alerts
+• Inventory Reports
+• Data Backup
+
+© {datetime.now().year} - Cost & Management Accounting Course
+"""
+
+# (column id, heading, width) specs for the two tables, shared at
+# module scope so tab construction does not re-build them
+PRODUCT_COLUMNS = (
+    ("sku", "SKU", 100),
+    ("name", "Name", 200),
+    ("category", "Category", 120),
+    ("price", "Price", 100),
+    ("quantity", "Quantity", 100),
+    ("value", "Value", 120),
+    ("status", "Status", 80),
+)
+SEARCH_COLUMNS = (
+    ("sku", "SKU", 100),
+    ("name", "Name", 200),
+    ("category", "Category", 120),
+    ("price", "Price", 100),
+    ("quantity", "Quantity", 100),
+    ("supplier", "Supplier", 150),
+)
+LOW_STOCK_COLUMNS = (
+    ("sku", "SKU", 90),
+    ("name", "Name", 190),
+    ("quantity", "Quantity", 80),
+    ("reorder", "Reorder At", 90),
+    ("supplier", "Supplier", 130),
+)
+
+# (label, product attribute, converter) rows driving the update dialog form
+UPDATE_FIELDS = (
+    ("Name", "name", str),
+    ("Category", "category", str),
+    ("Price ($)", "price", float),
+    ("Quantity", "quantity", int),
+    ("Description", "description", str),
+    ("Reorder Level", "reorder_level", int),
+    ("Supplier", "supplier", str),
+)
 
 
 class InventoryGUI:
@@ -18,7 +82,22 @@ class InventoryGUI:
     def __init__(self, storage_path: str = "inventory_data.json"):
         """Initialize the GUI with an inventory manager."""
         self.manager = InventoryManager(storage_path)
-        
+
+        # Mutations stay synchronous in memory, but the JSON write runs
+        # on a single worker thread so the Tk loop never blocks on disk
+        self.manager.autosave = False
+        self._save_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="inventory-save"
+        )
+        # Separate worker for search scans so a slow query never queues
+        # behind a disk write
+        self._search_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="inventory-search"
+        )
+
+        # True while a coalesced table rebuild is queued on the event loop
+        self._refresh_pending = False
+
         # Set appearance mode and color theme
         ctk.set_appearance_mode("dark")  # Dark mode
         ctk.set_default_color_theme("dark-blue")  # Base theme, customized with purple below
@@ -33,140 +112,346 @@ class InventoryGUI:
         self.purple_light = "#B19CD9"  # Light purple
         self.bg_dark = "#1a1a1a"  # Dark background
         self.bg_medium = "#2b2b2b"  # Medium background
-        
+
+        # Button color kwargs resolved once; every themed button reuses
+        # these dicts instead of restating the hex pairs
+        self._btn_styles = {
+            "primary": {
+                "fg_color": self.purple_primary,
+                "hover_color": self.purple_light,
+            },
+            "secondary": {
+                "fg_color": self.purple_dark,
+                "hover_color": self.purple_primary,
+            },
+            "danger": {
+                "fg_color": "#8B0000",
+                "hover_color": "#A52A2A",
+            },
+        }
+
+        # Shared fonts; CTkFont registers with Tk on construction, so
+        # build each variant once instead of per widget
+        self.font_title = ctk.CTkFont(size=16, weight="bold")
+        self.font_title_sm = ctk.CTkFont(size=14, weight="bold")
+        self.font_small = ctk.CTkFont(size=10)
+        self.font_mono = ctk.CTkFont(family="Courier", size=11)
+        
+        # Product list cache, invalidated on mutation so repeated
+        # renders and lookups do not re-query the manager
+        self._products_cache = None
+        self._product_by_sku = {}
+        # Lowercase field indices for the Search tab, rebuilt lazily
+        # after invalidation so repeated searches do not re-lowercase
+        # every product per query
+        self._search_index = None
+        # Memoized results keyed by (search type, lowercased term), so a
+        # repeated query skips the index scan entirely
+        self._search_cache = {}
+        # Key of the query currently rendered in the results tree, so a
+        # repeated search also skips the delete/insert churn
+        self._rendered_search_key = None
+
+        # Update dialog built on first use and hidden on close; reopening
+        # re-populates the existing entries
+        self._update_dialog = None
+        self._update_entries = {}
+        self._update_sku = None
+        # Low-stock dialog, same build-once / hide-on-close lifecycle
+        self._low_stock_dialog = None
+
+        # Pending after() id for clearing the transient status label
+        self._status_clear_id = None
+        self._status_color = None
+
+        # Pending after() id for the debounced search
+        self._search_after_id = None
+
+        # Last generated report keyed by the manager version, so
+        # re-opening the Reports tab with no mutations is O(1)
+        self._report_cache = (-1, "")
+        # Low-stock product list shared by the popup and the report
+        # view, also keyed by the manager version
+        self._low_stock_cache = (-1, [])
+        # Manager version at the last full table rebuild; refresh_all
+        # skips the rebuild when nothing has changed since
+        self._last_refresh_version = -1
+        # Pending after() id for the chunked table load
+        self._load_after_id = None
+        # Pending after() id for the chunked report pump, so starting a
+        # new render can cancel one still streaming
+        self._report_after_id = None
+        # Pending after() id for the coalesced save window
+        self._save_after_id = None
+
         # Create main container
         self.setup_ui()
-        
+
+    def _btn(self, parent, text, command, style: str = "primary", **kwargs):
+        """Create a themed CTkButton without restating the color kwargs."""
+        return ctk.CTkButton(
+            parent, text=text, command=command,
+            **self._btn_styles[style], **kwargs
+        )
+
+    def _get_products(self):
+        """Return the cached product list, fetching from the manager on miss."""
+        if self._products_cache is None:
+            self._products_cache = self.manager.get_all_products()
+            self._product_by_sku = {p.sku: p for p in self._products_cache}
+        return self._products_cache
+
+    def _get_product(self, sku):
+        """Look up a single product through the GUI-side cache."""
+        self._get_products()
+        return self._product_by_sku.get(sku)
+
+    def _invalidate_products(self):
+        """Drop the cached product list after a mutation."""
+        self._products_cache = None
+        self._product_by_sku = {}
+        self._search_index = None
+        self._search_cache.clear()
+        self._rendered_search_key = None
+
+    def _get_search_index(self):
+        """Return products grouped by lowercase name/category/supplier."""
+        if self._search_index is None:
+            by_name = {}
+            by_category = {}
+            by_supplier = {}
+            for p in self._get_products():
+                by_name.setdefault(p.name.casefold(), []).append(p)
+                by_category.setdefault(p.category.casefold(), []).append(p)
+                by_supplier.setdefault(p.supplier.casefold(), []).append(p)
+            self._search_index = {
+                "name": by_name,
+                "category": by_category,
+                "supplier": by_supplier,
+            }
+        return self._search_index
+
+    def _low_stock(self):
+        """Return the low-stock product list, shared between views.
+
+        The popup and the report tab both need this list; caching it
+        against the manager version means opening one after the other
+        costs a single materialization.
+        """
+        version = self.manager.version
+        if version != self._low_stock_cache[0]:
+            self._low_stock_cache = (version, self.manager.get_low_stock_products())
+        return self._low_stock_cache[1]
+
+    def _save_async(self):
+        """Schedule a coalesced save on the worker thread.
+
+        Mutations landing within the 250 ms window share one disk write;
+        the snapshot is taken when the window closes, on the Tk thread,
+        so a mutation arriving mid-write cannot reach the data being
+        serialized.
+        """
+        if self._save_after_id is None:
+            self._save_after_id = self.root.after(250, self._flush_save)
+
+    def _flush_save(self):
+        """Snapshot the products and hand the write to the worker."""
+        self._save_after_id = None
+        # Copy each product, not just the dict: the worker must never
+        # serialize the same mutable objects the Tk thread keeps
+        # editing, or a mid-write update could land a torn record on
+        # disk. Every Product field is an immutable scalar, so a
+        # shallow per-object copy is a complete value snapshot.
+        snapshot = {
+            sku: copy.copy(product)
+            for sku, product in self.manager.products.items()
+        }
+        self._save_executor.submit(self.manager.storage.save, snapshot)
+
     def setup_ui(self):
         """Set up the user interface."""
         # Create menu bar frame (since customtkinter doesn't support Menu)
         self.create_menu_bar()
         
         # Create tabview (replaces notebook)
-        self.tabview = ctk.CTkTabview(self.root, fg_color=self.bg_medium)
+        self.tabview = ctk.CTkTabview(
+            self.root, fg_color=self.bg_medium, command=self._on_tab_change
+        )
         self.tabview.pack(fill="both", expand=True, padx=10, pady=10)
-        
-        # Create tabs
-        self.create_products_tab()
-        self.create_add_product_tab()
-        self.create_stock_management_tab()
-        self.create_search_tab()
-        self.create_reports_tab()
-        
+
+        # Register all tabs up front but defer building each tab's
+        # widgets until the user first visits it; only the default tab
+        # pays its construction cost at startup
+        self._tab_builders = {
+            "All Products": self.create_products_tab,
+            "Add Product": self.create_add_product_tab,
+            "Stock Management": self.create_stock_management_tab,
+            "Search": self.create_search_tab,
+            "Reports": self.create_reports_tab,
+        }
+        self._built_tabs = set()
+        for name in self._tab_builders:
+            self.tabview.add(name)
+
+        self._build_tab("All Products")
+
+    def _build_tab(self, name: str):
+        """Build a tab's widgets the first time it is needed."""
+        if name not in self._built_tabs:
+            self._built_tabs.add(name)
+            self._tab_builders[name]()
+
+    def _on_tab_change(self):
+        """Construct the newly selected tab on first activation."""
+        self._build_tab(self.tabview.get())
+
     def create_menu_bar(self):
         """Create a menu bar using buttons in a frame."""
         menubar_frame = ctk.CTkFrame(self.root, fg_color=self.purple_dark, height=40)
         menubar_frame.pack(fill="x", padx=0, pady=0)
         
         # File menu buttons
-        ctk.CTkButton(
-            menubar_frame, text="Backup Data", 
-            command=self.backup_data,
-            fg_color=self.purple_primary,
-            hover_color=self.purple_light,
-            width=100
-        ).pack(side="left", padx=5, pady=5)
+        self._btn(menubar_frame, "Backup Data", self.backup_data, width=100).pack(side="left", padx=5, pady=5)
         
-        ctk.CTkButton(
-            menubar_frame, text="Refresh All", 
-            command=self.refresh_all,
-            fg_color=self.purple_primary,
-            hover_color=self.purple_light,
-            width=100
-        ).pack(side="left", padx=5, pady=5)
+        self._btn(menubar_frame, "Refresh All", self.refresh_all, width=100).pack(side="left", padx=5, pady=5)
         
-        ctk.CTkButton(
-            menubar_frame, text="Low Stock", 
-            command=self.show_low_stock,
-            fg_color=self.purple_primary,
-            hover_color=self.purple_light,
-            width=100
-        ).pack(side="left", padx=5, pady=5)
+        self._btn(menubar_frame, "Low Stock", self.show_low_stock, width=100).pack(side="left", padx=5, pady=5)
         
-        ctk.CTkButton(
-            menubar_frame, text="About", 
-            command=self.show_about,
-            fg_color=self.purple_primary,
-            hover_color=self.purple_light,
-            width=80
-        ).pack(side="left", padx=5, pady=5)
-        
-        ctk.CTkButton(
-            menubar_frame, text="Exit", 
-            command=self.root.quit,
-            fg_color="#8B0000",  # Dark red for exit
-            hover_color="#A52A2A",
-            width=80
-        ).pack(side="right", padx=5, pady=5)
+        self._btn(menubar_frame, "About", self.show_about, width=80).pack(side="left", padx=5, pady=5)
+        
+        self._btn(menubar_frame, "Exit", self._on_exit, style="danger", width=80).pack(side="right", padx=5, pady=5)
+        
+        # Inline status area; success feedback lands here instead of in
+        # a modal messagebox, which would block the event loop. The text
+        # goes through a StringVar so updates are a C-side variable set
+        # rather than a full configure pass.
+        self._status_var = ctk.StringVar(master=self.root)
+        self.status_label = ctk.CTkLabel(
+            menubar_frame, textvariable=self._status_var,
+            text_color=self.purple_light
+        )
+        self.status_label.pack(side="right", padx=10, pady=5)
+
+    def _flash_status(self, message: str, error: bool = False):
+        """Show a transient message in the menu bar status area."""
+        color = "#FF6B6B" if error else self.purple_light
+        if color != self._status_color:
+            self._status_color = color
+            self.status_label.configure(text_color=color)
+        self._status_var.set(message)
+        if self._status_clear_id is not None:
+            self.root.after_cancel(self._status_clear_id)
+        self._status_clear_id = self.root.after(2500, self._clear_status)
+
+    def _clear_status(self):
+        self._status_clear_id = None
+        self._status_var.set("")
     
     def create_products_tab(self):
         """Create the products listing tab."""
-        self.tabview.add("All Products")
         products_frame = self.tabview.tab("All Products")
         
         # Top frame with buttons
         top_frame = ctk.CTkFrame(products_frame, fg_color="transparent")
         top_frame.pack(fill="x", padx=5, pady=5)
         
-        ctk.CTkButton(
-            top_frame, text="Refresh", 
-            command=self.refresh_products_list,
-            fg_color=self.purple_primary,
-            hover_color=self.purple_light
-        ).pack(side="left", padx=5)
+        self._btn(top_frame, "Refresh", self.refresh_products_list).pack(side="left", padx=5)
         
-        ctk.CTkButton(
-            top_frame, text="View Details", 
-            command=self.view_product_details,
-            fg_color=self.purple_primary,
-            hover_color=self.purple_light
-        ).pack(side="left", padx=5)
+        self._btn(top_frame, "View Details", self.view_product_details).pack(side="left", padx=5)
         
-        ctk.CTkButton(
-            top_frame, text="Update Product", 
-            command=self.update_product_dialog,
-            fg_color=self.purple_primary,
-            hover_color=self.purple_light
-        ).pack(side="left", padx=5)
-        
-        ctk.CTkButton(
-            top_frame, text="Delete Product", 
-            command=self.delete_product,
-            fg_color="#8B0000",
-            hover_color="#A52A2A"
-        ).pack(side="left", padx=5)
-        
-        # Create scrollable frame for products table
-        self.products_scroll = ctk.CTkScrollableFrame(
-            products_frame, 
-            fg_color=self.bg_medium,
-            height=500
-        )
-        self.products_scroll.pack(fill="both", expand=True, padx=5, pady=5)
-        
-        # Create table header
-        headers = ["", "SKU", "Name", "Category", "Price", "Quantity", "Value", "Status"]
-        header_widths = [30, 100, 200, 120, 100, 100, 120, 80]
-        
-        for col, (header, width) in enumerate(zip(headers, header_widths)):
-            label = ctk.CTkLabel(
-                self.products_scroll, 
-                text=header, 
-                font=ctk.CTkFont(weight="bold", size=12),
-                fg_color=self.purple_dark,
-                width=width
-            )
-            label.grid(row=0, column=col, padx=2, pady=2, sticky="ew")
+        self._btn(top_frame, "Update Product", self.update_product_dialog).pack(side="left", padx=5)
         
-        # Store product row data
-        self.product_rows = []
+        self._btn(top_frame, "Delete Product", self.delete_product, style="danger").pack(side="left", padx=5)
         
+        # A native Treeview draws all rows inside one C-level widget and
+        # virtualizes scrolling internally, unlike the previous grid of
+        # canvas-backed CTkLabels (one widget per cell)
+        self._style_treeview()
+
+        tree_frame = ctk.CTkFrame(products_frame, fg_color=self.bg_medium)
+        tree_frame.pack(fill="both", expand=True, padx=5, pady=5)
+
+        self.products_tree = self._make_tree(tree_frame, PRODUCT_COLUMNS, height=20)
+
+        # Row status styling is configured once here; refreshes only
+        # assign the precomputed tags
+        self.products_tree.tag_configure("low", foreground="#FF6B6B")
+        self.products_tree.tag_configure("ok", foreground="#51CF66")
+
+        scrollbar = ttk.Scrollbar(
+            tree_frame, orient="vertical", command=self.products_tree.yview
+        )
+        self.products_tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        self.products_tree.pack(fill="both", expand=True, padx=5, pady=5)
+
+        # Track the selection as it changes so button handlers read a
+        # plain attribute instead of doing a Tcl round-trip per click
+        self._selected_sku = None
+        self.products_tree.bind("<<TreeviewSelect>>", self._on_product_select)
+
         # Populate the table
         self.refresh_products_list()
+
+    def _on_product_select(self, _event=None):
+        """Remember the SKU of the currently selected table row."""
+        selection = self.products_tree.selection()
+        self._selected_sku = selection[0] if selection else None
+
+    def _schedule_refresh(self):
+        """Coalesce table rebuilds from rapid mutations.
+
+        N mutations in the same event-loop tick trigger a single
+        rebuild once the loop goes idle.
+        """
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.root.after_idle(self._do_refresh)
+
+    def _do_refresh(self):
+        self._refresh_pending = False
+        self.refresh_products_list()
+
+    def _make_tree(self, parent, cols, **kwargs) -> ttk.Treeview:
+        """Build a headings-only Treeview from a (id, heading, width) spec.
+
+        One data-driven pass replaces the per-tab heading/column call
+        pairs, so each table is configured identically and cheaply.
+        """
+        tree = ttk.Treeview(
+            parent,
+            columns=[c[0] for c in cols],
+            show="headings",
+            selectmode="browse",
+            **kwargs
+        )
+        for col, heading, width in cols:
+            tree.heading(col, text=heading)
+            tree.column(col, width=width, anchor="w")
+        return tree
+
+    def _style_treeview(self):
+        """Apply the dark purple theme to ttk.Treeview widgets."""
+        style = ttk.Style(self.root)
+        style.theme_use("clam")
+        style.configure(
+            "Treeview",
+            background=self.bg_medium,
+            foreground="white",
+            fieldbackground=self.bg_medium,
+            rowheight=28,
+            borderwidth=0
+        )
+        style.configure(
+            "Treeview.Heading",
+            background=self.purple_dark,
+            foreground="white",
+            relief="flat"
+        )
+        style.map("Treeview", background=[("selected", self.purple_primary)])
     
     def create_add_product_tab(self):
         """Create the add product tab."""
-        self.tabview.add("Add Product")
         add_frame = self.tabview.tab("Add Product")
         
         # Create form in a scrollable frame
@@ -175,11 +460,15 @@ class InventoryGUI:
         
         form_frame = ctk.CTkFrame(form_scroll, fg_color=self.bg_medium)
         form_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        # Pin the column widths up front so each later grid() call does
+        # not renegotiate the whole column layout
+        form_frame.grid_columnconfigure(0, weight=0, minsize=140)
+        form_frame.grid_columnconfigure(1, weight=0)
         
         title_label = ctk.CTkLabel(
             form_frame, 
             text="Product Information",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self.font_title,
             text_color=self.purple_light
         )
         title_label.grid(row=0, column=0, columnspan=2, pady=(10, 20))
@@ -228,7 +517,7 @@ class InventoryGUI:
         ctk.CTkLabel(
             form_frame, 
             text="(Leave blank for auto-generated)",
-            font=ctk.CTkFont(size=10),
+            font=self.font_small,
             text_color="gray"
         ).grid(row=9, column=1, sticky="w", padx=10)
         
@@ -236,36 +525,25 @@ class InventoryGUI:
         button_frame = ctk.CTkFrame(form_frame, fg_color="transparent")
         button_frame.grid(row=10, column=0, columnspan=2, pady=20)
         
-        ctk.CTkButton(
-            button_frame, text="Add Product", 
-            command=self.add_product,
-            fg_color=self.purple_primary,
-            hover_color=self.purple_light,
-            width=120
-        ).pack(side="left", padx=5)
-        
-        ctk.CTkButton(
-            button_frame, text="Clear Form", 
-            command=self.clear_add_form,
-            fg_color=self.purple_dark,
-            hover_color=self.purple_primary,
-            width=120
-        ).pack(side="left", padx=5)
+        self._btn(button_frame, "Add Product", self.add_product, width=120).pack(side="left", padx=5)
+        
+        self._btn(button_frame, "Clear Form", self.clear_add_form, style="secondary", width=120).pack(side="left", padx=5)
     
     def create_stock_management_tab(self):
         """Create the stock management tab."""
-        self.tabview.add("Stock Management")
         stock_frame = self.tabview.tab("Stock Management")
         
         # Create two sections: Add Stock and Remove Stock
         add_stock_frame = ctk.CTkFrame(stock_frame, fg_color=self.bg_medium)
         add_stock_frame.pack(fill="both", expand=True, padx=20, pady=10)
+        add_stock_frame.grid_columnconfigure(0, weight=0, minsize=140)
+        add_stock_frame.grid_columnconfigure(1, weight=0)
         
         # Add Stock section title
         ctk.CTkLabel(
             add_stock_frame, 
             text="Add Stock",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self.font_title,
             text_color=self.purple_light
         ).grid(row=0, column=0, columnspan=2, pady=(10, 20))
         
@@ -276,23 +554,20 @@ class InventoryGUI:
         ctk.CTkLabel(add_stock_frame, text="Quantity to Add:").grid(row=2, column=0, sticky="w", pady=5, padx=10)
         self.add_stock_qty_entry = ctk.CTkEntry(add_stock_frame, width=250)
         self.add_stock_qty_entry.grid(row=2, column=1, pady=5, padx=10)
+        self.add_stock_qty_entry.bind("<Return>", lambda e: self.add_stock())
         
-        ctk.CTkButton(
-            add_stock_frame, text="Add Stock", 
-            command=self.add_stock,
-            fg_color=self.purple_primary,
-            hover_color=self.purple_light,
-            width=200
-        ).grid(row=3, column=0, columnspan=2, pady=10)
+        self._btn(add_stock_frame, "Add Stock", self.add_stock, width=200).grid(row=3, column=0, columnspan=2, pady=10)
         
         # Remove Stock section
         remove_stock_frame = ctk.CTkFrame(stock_frame, fg_color=self.bg_medium)
         remove_stock_frame.pack(fill="both", expand=True, padx=20, pady=10)
+        remove_stock_frame.grid_columnconfigure(0, weight=0, minsize=140)
+        remove_stock_frame.grid_columnconfigure(1, weight=0)
         
         ctk.CTkLabel(
             remove_stock_frame, 
             text="Remove Stock (Sale)",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self.font_title,
             text_color=self.purple_light
         ).grid(row=0, column=0, columnspan=2, pady=(10, 20))
         
@@ -303,28 +578,24 @@ class InventoryGUI:
         ctk.CTkLabel(remove_stock_frame, text="Quantity to Remove:").grid(row=2, column=0, sticky="w", pady=5, padx=10)
         self.remove_stock_qty_entry = ctk.CTkEntry(remove_stock_frame, width=250)
         self.remove_stock_qty_entry.grid(row=2, column=1, pady=5, padx=10)
+        self.remove_stock_qty_entry.bind("<Return>", lambda e: self.remove_stock())
         
-        ctk.CTkButton(
-            remove_stock_frame, text="Remove Stock", 
-            command=self.remove_stock,
-            fg_color=self.purple_primary,
-            hover_color=self.purple_light,
-            width=200
-        ).grid(row=3, column=0, columnspan=2, pady=10)
+        self._btn(remove_stock_frame, "Remove Stock", self.remove_stock, width=200).grid(row=3, column=0, columnspan=2, pady=10)
     
     def create_search_tab(self):
         """Create the search tab."""
-        self.tabview.add("Search")
         search_frame = self.tabview.tab("Search")
         
         # Search controls
         control_frame = ctk.CTkFrame(search_frame, fg_color=self.bg_medium)
         control_frame.pack(fill="x", padx=20, pady=10)
+        control_frame.grid_columnconfigure(0, weight=0, minsize=100)
+        control_frame.grid_columnconfigure(1, weight=1)
         
         ctk.CTkLabel(
             control_frame, 
             text="Search Options",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self.font_title_sm,
             text_color=self.purple_light
         ).grid(row=0, column=0, columnspan=4, pady=(10, 15))
         
@@ -355,14 +626,10 @@ class InventoryGUI:
         ctk.CTkLabel(control_frame, text="Search Term:").grid(row=2, column=0, sticky="w", pady=5, padx=10)
         self.search_entry = ctk.CTkEntry(control_frame, width=400)
         self.search_entry.grid(row=2, column=1, columnspan=2, pady=5, padx=5, sticky="ew")
+        self.search_entry.bind("<KeyRelease>", self._on_search_key)
+        self.search_entry.bind("<Return>", lambda e: self.search_products())
         
-        ctk.CTkButton(
-            control_frame, text="Search", 
-            command=self.search_products,
-            fg_color=self.purple_primary,
-            hover_color=self.purple_light,
-            width=100
-        ).grid(row=2, column=3, padx=5)
+        self._btn(control_frame, "Search", self.search_products, width=100).grid(row=2, column=3, padx=5)
         
         # Results frame with scrollable content
         results_frame = ctk.CTkFrame(search_frame, fg_color=self.bg_medium)
@@ -371,58 +638,30 @@ class InventoryGUI:
         ctk.CTkLabel(
             results_frame, 
             text="Search Results",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self.font_title_sm,
             text_color=self.purple_light
         ).pack(pady=(10, 5))
         
-        self.search_scroll = ctk.CTkScrollableFrame(
-            results_frame, 
-            fg_color=self.bg_dark,
-            height=350
+        self.search_tree = self._make_tree(results_frame, SEARCH_COLUMNS, height=12)
+
+        scrollbar = ttk.Scrollbar(
+            results_frame, orient="vertical", command=self.search_tree.yview
         )
-        self.search_scroll.pack(fill="both", expand=True, padx=10, pady=10)
-        
-        # Create table header for search results
-        headers = ["SKU", "Name", "Category", "Price", "Quantity", "Supplier"]
-        header_widths = [100, 200, 120, 100, 100, 150]
-        
-        for col, (header, width) in enumerate(zip(headers, header_widths)):
-            label = ctk.CTkLabel(
-                self.search_scroll, 
-                text=header, 
-                font=ctk.CTkFont(weight="bold", size=12),
-                fg_color=self.purple_dark,
-                width=width
-            )
-            label.grid(row=0, column=col, padx=2, pady=2, sticky="ew")
-        
-        # Store search result rows
-        self.search_rows = []
+        self.search_tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        self.search_tree.pack(fill="both", expand=True, padx=10, pady=10)
     
     def create_reports_tab(self):
         """Create the reports tab."""
-        self.tabview.add("Reports")
         reports_frame = self.tabview.tab("Reports")
         
         # Buttons frame
         button_frame = ctk.CTkFrame(reports_frame, fg_color="transparent")
         button_frame.pack(fill="x", padx=10, pady=10)
         
-        ctk.CTkButton(
-            button_frame, text="Generate Full Report", 
-            command=self.generate_report,
-            fg_color=self.purple_primary,
-            hover_color=self.purple_light,
-            width=150
-        ).pack(side="left", padx=5)
+        self._btn(button_frame, "Generate Full Report", self.generate_report, width=150).pack(side="left", padx=5)
         
-        ctk.CTkButton(
-            button_frame, text="View Low Stock", 
-            command=self.show_low_stock_in_report,
-            fg_color=self.purple_primary,
-            hover_color=self.purple_light,
-            width=150
-        ).pack(side="left", padx=5)
+        self._btn(button_frame, "View Low Stock", self.show_low_stock_in_report, width=150).pack(side="left", padx=5)
         
         # Text area for report
         self.report_text = ctk.CTkTextbox(
@@ -431,67 +670,109 @@ class InventoryGUI:
             width=1000, 
             height=500,
             fg_color=self.bg_dark,
-            font=ctk.CTkFont(family="Courier", size=11)
+            font=self.font_mono
         )
         self.report_text.pack(fill="both", expand=True, padx=10, pady=10)
     
     # Action methods
     
     def refresh_products_list(self):
-        """Refresh the products list in the table."""
-        # Clear existing items
-        for row_widgets in self.product_rows:
-            for widget in row_widgets:
-                widget.destroy()
-        self.product_rows = []
-        
-        # Get all products and populate
-        products = self.manager.get_all_products()
-        for idx, product in enumerate(products):
-            row = idx + 1  # +1 for header row
-            status = "LOW" if product.is_low_stock() else "OK"
-            status_color = "#FF6B6B" if status == "LOW" else "#51CF66"
-            
-            # Create checkbox for selection
-            var = ctk.BooleanVar()
-            checkbox = ctk.CTkCheckBox(
-                self.products_scroll, text="", variable=var, width=30,
-                fg_color=self.purple_primary,
-                hover_color=self.purple_light
+        """Refresh the products list in the table.
+
+        The first chunk of rows is inserted synchronously so the table
+        paints immediately; the remainder streams in via after_idle so a
+        large catalog never stalls the event loop in one pass.
+        """
+        if (
+            self.manager.version == self._last_refresh_version
+            and self._load_after_id is None
+        ):
+            # Nothing mutated since the last completed rebuild; the
+            # reflexive Refresh click costs nothing
+            return
+        products = self._get_products()
+
+        tree = self.products_tree
+        if self._load_after_id is not None:
+            self.root.after_cancel(self._load_after_id)
+            self._load_after_id = None
+        # Unmap the tree while the visible chunk is rebuilt so Tk
+        # performs a single layout/redraw pass when it is repacked
+        tree.pack_forget()
+        try:
+            children = tree.get_children()
+            if children:
+                tree.delete(*children)
+            self._selected_sku = None
+            self._insert_product_chunk(products, 0)
+        finally:
+            tree.pack(fill="both", expand=True, padx=5, pady=5)
+        self._last_refresh_version = self.manager.version
+
+    def _insert_product_chunk(self, products, start: int):
+        """Insert one bounded slice of rows, rescheduling for the rest."""
+        self._load_after_id = None
+        tree = self.products_tree
+        end = min(start + PRODUCT_CHUNK_SIZE, len(products))
+        for product in products[start:end]:
+            if tree.exists(product.sku):
+                continue
+            values, low = product.cached_row()
+            tree.insert(
+                "", "end",
+                iid=product.sku,
+                values=values,
+                tags=("low",) if low else ("ok",)
             )
-            checkbox.grid(row=row, column=0, padx=2, pady=2)
-            
-            # Create labels for each column
-            values = [
-                product.sku,
-                product.name,
-                product.category,
-                f"${product.price:.2f}",
-                str(product.quantity),
-                f"${product.total_value():.2f}",
-                status
-            ]
-            
-            widths = [100, 200, 120, 100, 100, 120, 80]
-            row_widgets = [checkbox]
-            
-            for col, (value, width) in enumerate(zip(values, widths), start=1):
-                fg_color = status_color if col == 7 else "transparent"
-                label = ctk.CTkLabel(
-                    self.products_scroll, 
-                    text=value,
-                    width=width,
-                    fg_color=fg_color,
-                    corner_radius=5
-                )
-                label.grid(row=row, column=col, padx=2, pady=2, sticky="ew")
-                row_widgets.append(label)
-            
-            # Store the row with its data
-            self.product_rows.append(row_widgets)
-            # Store the SKU with the checkbox variable for later reference
-            checkbox.sku = product.sku
-            checkbox.var = var
+        if end < len(products):
+            self._load_after_id = self.root.after_idle(
+                self._insert_product_chunk, products, end
+            )
+
+    def _upsert_row(self, sku: str):
+        """Insert or update the single row for sku without a full rebuild.
+
+        Falls back to a full refresh only when the product cannot be
+        found (e.g. it was deleted concurrently).
+        """
+        product = self._get_product(sku)
+
+        if product is None:
+            self._schedule_refresh()
+            return
+
+        values, low = product.cached_row()
+        tags = ("low",) if low else ("ok",)
+        tree = self.products_tree
+        if tree.exists(sku):
+            tree.item(sku, values=values, tags=tags)
+        else:
+            tree.insert("", "end", iid=sku, values=values, tags=tags)
+
+    def _update_stock_cells(self, sku: str):
+        """Update only the quantity-derived cells after a stock change.
+
+        tree.set touches a single column each, so the repaint region is
+        three cells rather than the whole row.
+        """
+        product = self._get_product(sku)
+        tree = self.products_tree
+        if product is None or not tree.exists(sku):
+            self._upsert_row(sku)
+            return
+        values, low = product.cached_row()
+        tree.set(sku, "quantity", values[4])
+        tree.set(sku, "value", values[5])
+        tree.set(sku, "status", values[6])
+        tree.item(sku, tags=("low",) if low else ("ok",))
+
+    def _remove_row(self, sku: str):
+        """Delete the single row for sku if it is displayed."""
+        tree = self.products_tree
+        if tree.exists(sku):
+            tree.delete(sku)
+            if self._selected_sku == sku:
+                self._selected_sku = None
     
     def add_product(self):
         """Add a new product."""
@@ -521,9 +802,11 @@ class InventoryGUI:
             )
             
             if success:
-                messagebox.showinfo("Success", message)
+                self._flash_status(message)
                 self.clear_add_form()
-                self.refresh_products_list()
+                self._invalidate_products()
+                self._save_async()
+                self._upsert_row(self.manager.last_added_sku)
             else:
                 messagebox.showerror("Error", message)
                 
@@ -543,12 +826,8 @@ class InventoryGUI:
         self.add_sku_entry.delete(0, "end")
     
     def get_selected_product_sku(self):
-        """Get the SKU of the selected product from checkboxes."""
-        for row_widgets in self.product_rows:
-            checkbox = row_widgets[0]
-            if hasattr(checkbox, 'var') and checkbox.var.get():
-                return checkbox.sku
-        return None
+        """Get the SKU of the selected product, tracked on selection events."""
+        return self._selected_sku
     
     def view_product_details(self):
         """View detailed information about selected product."""
@@ -557,7 +836,7 @@ class InventoryGUI:
             messagebox.showwarning("Warning", "Please select a product first!")
             return
         
-        product = self.manager.get_product(sku)
+        product = self._get_product(sku)
         
         if product:
             details = f"""
@@ -567,11 +846,11 @@ Product Details
 SKU:           {product.sku}
 Name:          {product.name}
 Category:      {product.category}
-Price:         ${product.price:.2f}
+Price:         {product.price_display}
 Quantity:      {product.quantity}
 Description:   {product.description or 'N/A'}
 Reorder Level: {product.reorder_level}
-Supplier:      {product.supplier or 'N/A'}
+Supplier:      {product.supplier_display}
 Created:       {product.created_at}
 Last Updated:  {product.updated_at}
 Total Value:   ${product.total_value():.2f}
@@ -580,104 +859,91 @@ Stock Status:  {'LOW STOCK!' if product.is_low_stock() else 'OK'}
             messagebox.showinfo("Product Details", details)
     
     def update_product_dialog(self):
-        """Open dialog to update selected product."""
+        """Open the update dialog for the selected product.
+
+        The Toplevel and its form are built once and hidden on close;
+        subsequent opens re-populate the existing entries instead of
+        reconstructing the widget tree.
+        """
         sku = self.get_selected_product_sku()
         if not sku:
             messagebox.showwarning("Warning", "Please select a product first!")
             return
         
-        product = self.manager.get_product(sku)
+        product = self._get_product(sku)
         
         if not product:
             messagebox.showerror("Error", "Product not found!")
             return
         
-        # Create update dialog
+        if self._update_dialog is None:
+            self._build_update_dialog()
+
+        self._update_sku = sku
+        for _label, attr, _conv in UPDATE_FIELDS:
+            entry = self._update_entries[attr]
+            entry.delete(0, "end")
+            value = getattr(product, attr)
+            entry.insert(0, "" if value is None else str(value))
+
+        self._update_dialog.title(f"Update Product - {product.name}")
+        self._update_dialog.deiconify()
+        self._update_dialog.lift()
+
+    def _build_update_dialog(self):
+        """Construct the update dialog form from the field spec."""
         dialog = ctk.CTkToplevel(self.root)
-        dialog.title(f"Update Product - {product.name}")
         dialog.geometry("500x500")
         dialog.configure(fg_color=self.bg_dark)
+        dialog.withdraw()
+        # Closing just hides the dialog so it can be reused
+        dialog.protocol("WM_DELETE_WINDOW", dialog.withdraw)
+        dialog.bind("<Return>", lambda e: self._save_update())
         
         # Create scrollable form
         scroll = ctk.CTkScrollableFrame(dialog, fg_color="transparent")
         scroll.pack(fill="both", expand=True, padx=10, pady=10)
+        scroll.grid_columnconfigure(0, weight=0, minsize=120)
+        scroll.grid_columnconfigure(1, weight=0)
         
-        # Create form
-        ctk.CTkLabel(scroll, text="Name:").grid(row=0, column=0, sticky="w", padx=10, pady=5)
-        name_entry = ctk.CTkEntry(scroll, width=300)
-        name_entry.insert(0, product.name)
-        name_entry.grid(row=0, column=1, padx=10, pady=5)
-        
-        ctk.CTkLabel(scroll, text="Category:").grid(row=1, column=0, sticky="w", padx=10, pady=5)
-        category_entry = ctk.CTkEntry(scroll, width=300)
-        category_entry.insert(0, product.category)
-        category_entry.grid(row=1, column=1, padx=10, pady=5)
-        
-        ctk.CTkLabel(scroll, text="Price ($):").grid(row=2, column=0, sticky="w", padx=10, pady=5)
-        price_entry = ctk.CTkEntry(scroll, width=300)
-        price_entry.insert(0, str(product.price))
-        price_entry.grid(row=2, column=1, padx=10, pady=5)
-        
-        ctk.CTkLabel(scroll, text="Quantity:").grid(row=3, column=0, sticky="w", padx=10, pady=5)
-        quantity_entry = ctk.CTkEntry(scroll, width=300)
-        quantity_entry.insert(0, str(product.quantity))
-        quantity_entry.grid(row=3, column=1, padx=10, pady=5)
-        
-        ctk.CTkLabel(scroll, text="Description:").grid(row=4, column=0, sticky="w", padx=10, pady=5)
-        description_entry = ctk.CTkEntry(scroll, width=300)
-        description_entry.insert(0, product.description or "")
-        description_entry.grid(row=4, column=1, padx=10, pady=5)
-        
-        ctk.CTkLabel(scroll, text="Reorder Level:").grid(row=5, column=0, sticky="w", padx=10, pady=5)
-        reorder_entry = ctk.CTkEntry(scroll, width=300)
-        reorder_entry.insert(0, str(product.reorder_level))
-        reorder_entry.grid(row=5, column=1, padx=10, pady=5)
-        
-        ctk.CTkLabel(scroll, text="Supplier:").grid(row=6, column=0, sticky="w", padx=10, pady=5)
-        supplier_entry = ctk.CTkEntry(scroll, width=300)
-        supplier_entry.insert(0, product.supplier or "")
-        supplier_entry.grid(row=6, column=1, padx=10, pady=5)
-        
-        def save_update():
-            try:
-                success, message = self.manager.update_product(
-                    sku=sku,
-                    name=name_entry.get().strip() or None,
-                    category=category_entry.get().strip() or None,
-                    price=float(price_entry.get().strip()) if price_entry.get().strip() else None,
-                    quantity=int(quantity_entry.get().strip()) if quantity_entry.get().strip() else None,
-                    description=description_entry.get().strip() or None,
-                    reorder_level=int(reorder_entry.get().strip()) if reorder_entry.get().strip() else None,
-                    supplier=supplier_entry.get().strip() or None
-                )
-                
-                if success:
-                    messagebox.showinfo("Success", message)
-                    dialog.destroy()
-                    self.refresh_products_list()
-                else:
-                    messagebox.showerror("Error", message)
-            except ValueError as e:
-                messagebox.showerror("Error", f"Invalid input: {str(e)}")
+        for row, (label, attr, _conv) in enumerate(UPDATE_FIELDS):
+            ctk.CTkLabel(scroll, text=f"{label}:").grid(
+                row=row, column=0, sticky="w", padx=10, pady=5
+            )
+            entry = ctk.CTkEntry(scroll, width=300)
+            entry.grid(row=row, column=1, padx=10, pady=5)
+            self._update_entries[attr] = entry
         
         button_frame = ctk.CTkFrame(scroll, fg_color="transparent")
-        button_frame.grid(row=7, column=0, columnspan=2, pady=20)
+        button_frame.grid(row=len(UPDATE_FIELDS), column=0, columnspan=2, pady=20)
         
-        ctk.CTkButton(
-            button_frame, text="Save", 
-            command=save_update,
-            fg_color=self.purple_primary,
-            hover_color=self.purple_light,
-            width=100
-        ).pack(side="left", padx=10)
-        
-        ctk.CTkButton(
-            button_frame, text="Cancel", 
-            command=dialog.destroy,
-            fg_color=self.purple_dark,
-            hover_color=self.purple_primary,
-            width=100
-        ).pack(side="left", padx=10)
+        self._btn(button_frame, "Save", self._save_update, width=100).pack(side="left", padx=10)
+        
+        self._btn(button_frame, "Cancel", dialog.withdraw, style="secondary", width=100).pack(side="left", padx=10)
+        
+        self._update_dialog = dialog
+
+    def _save_update(self):
+        """Apply the update dialog's entries to the product being edited."""
+        sku = self._update_sku
+        try:
+            kwargs = {}
+            for _label, attr, conv in UPDATE_FIELDS:
+                raw = self._update_entries[attr].get().strip()
+                kwargs[attr] = conv(raw) if raw else None
+            
+            success, message = self.manager.update_product(sku=sku, **kwargs)
+            
+            if success:
+                self._flash_status(message)
+                self._update_dialog.withdraw()
+                self._invalidate_products()
+                self._save_async()
+                self._upsert_row(sku)
+            else:
+                messagebox.showerror("Error", message)
+        except ValueError as e:
+            messagebox.showerror("Error", f"Invalid input: {str(e)}")
     
     def delete_product(self):
         """Delete the selected product."""
@@ -686,31 +952,35 @@ Stock Status:  {'LOW STOCK!' if product.is_low_stock() else 'OK'}
             messagebox.showwarning("Warning", "Please select a product first!")
             return
         
-        product = self.manager.get_product(sku)
+        product = self._get_product(sku)
         
         if product:
             if messagebox.askyesno("Confirm Delete", 
                                    f"Are you sure you want to delete '{product.name}'?"):
                 success, message = self.manager.delete_product(sku)
                 if success:
-                    messagebox.showinfo("Success", message)
-                    self.refresh_products_list()
+                    self._flash_status(message)
+                    self._invalidate_products()
+                    self._save_async()
+                    self._remove_row(sku)
                 else:
                     messagebox.showerror("Error", message)
     
     def add_stock(self):
         """Add stock to a product."""
         try:
-            sku = self.add_stock_sku_entry.get().strip().upper()
+            sku = self.manager.normalize_sku(self.add_stock_sku_entry.get())
             quantity = int(self.add_stock_qty_entry.get().strip())
             
             success, message = self.manager.add_stock(sku, quantity)
             
             if success:
-                messagebox.showinfo("Success", message)
+                self._flash_status(message)
                 self.add_stock_sku_entry.delete(0, "end")
                 self.add_stock_qty_entry.delete(0, "end")
-                self.refresh_products_list()
+                self._invalidate_products()
+                self._save_async()
+                self._update_stock_cells(sku)
             else:
                 messagebox.showerror("Error", message)
                 
@@ -720,16 +990,18 @@ Stock Status:  {'LOW STOCK!' if product.is_low_stock() else 'OK'}
     def remove_stock(self):
         """Remove stock from a product."""
         try:
-            sku = self.remove_stock_sku_entry.get().strip().upper()
+            sku = self.manager.normalize_sku(self.remove_stock_sku_entry.get())
             quantity = int(self.remove_stock_qty_entry.get().strip())
             
             success, message = self.manager.remove_stock(sku, quantity)
             
             if success:
-                messagebox.showinfo("Success", message)
+                self._flash_status(message)
                 self.remove_stock_sku_entry.delete(0, "end")
                 self.remove_stock_qty_entry.delete(0, "end")
-                self.refresh_products_list()
+                self._invalidate_products()
+                self._save_async()
+                self._update_stock_cells(sku)
             else:
                 messagebox.showerror("Error", message)
                 
@@ -737,148 +1009,326 @@ Stock Status:  {'LOW STOCK!' if product.is_low_stock() else 'OK'}
             messagebox.showerror("Error", "Invalid quantity!")
     
     def search_products(self):
-        """Search for products."""
-        # Clear existing results
-        for row_widgets in self.search_rows:
-            for widget in row_widgets:
-                widget.destroy()
-        self.search_rows = []
-        
+        """Schedule a debounced search.
+
+        Rapid repeat invocations (button mashing, Return-key repeats)
+        collapse into one scan + render once the 175 ms window passes.
+        """
+        self._debounce_search(from_typing=False)
+
+    def _on_search_key(self, _event=None):
+        """Search as the user types, without the empty-term warning."""
+        self._debounce_search(from_typing=True)
+
+    def _debounce_search(self, from_typing: bool):
+        if self._search_after_id is not None:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(
+            175, self._search_products_now, from_typing
+        )
+
+    def _search_products_now(self, from_typing: bool = False):
+        """Search for products.
+
+        Cache hits render immediately; misses hand the index scan to the
+        worker executor and marshal the results back with root.after, so
+        typing never blocks on a large catalog scan.
+        """
+        self._search_after_id = None
         search_term = self.search_entry.get().strip()
         search_type = self.search_type.get()
         
         if not search_term:
-            messagebox.showwarning("Warning", "Please enter a search term!")
+            if from_typing:
+                children = self.search_tree.get_children()
+                if children:
+                    self.search_tree.delete(*children)
+                self._rendered_search_key = None
+            else:
+                messagebox.showwarning("Warning", "Please enter a search term!")
             return
         
-        if search_type == "name":
-            results = self.manager.search_by_name(search_term)
-        elif search_type == "category":
-            results = self.manager.search_by_category(search_term)
-        elif search_type == "supplier":
-            results = self.manager.search_by_supplier(search_term)
-        else:
-            results = []
+        term_lc = search_term.casefold()
+        cache_key = (search_type, term_lc)
+        if cache_key == self._rendered_search_key:
+            # The tree already shows exactly these rows; nothing to redo
+            return
+        results = self._search_cache.get(cache_key)
+        if results is not None:
+            self._render_search_results(cache_key, results, from_typing)
+            return
         
-        if results:
-            for idx, product in enumerate(results):
-                row = idx + 1  # +1 for header row
-                values = [
-                    product.sku,
-                    product.name,
-                    product.category,
-                    f"${product.price:.2f}",
-                    str(product.quantity),
-                    product.supplier or "N/A"
-                ]
-                
-                widths = [100, 200, 120, 100, 100, 150]
-                row_widgets = []
-                
-                for col, (value, width) in enumerate(zip(values, widths)):
-                    label = ctk.CTkLabel(
-                        self.search_scroll, 
-                        text=value,
-                        width=width,
-                        fg_color=self.bg_medium
+        # Build the index on the Tk thread (it touches the product
+        # cache), then scan it off-thread
+        index = self._get_search_index()
+        future = self._search_executor.submit(
+            self._scan_index, index, search_type, term_lc
+        )
+        future.add_done_callback(
+            lambda f: self.root.after(
+                0, self._search_done, cache_key, f.result(), from_typing
+            )
+        )
+
+    @staticmethod
+    def _scan_index(index, search_type, term_lc):
+        """Pure-Python index scan, safe to run off the Tk thread."""
+        if search_type == "category":
+            # Categories match exactly, so this is a single dict lookup
+            return index["category"].get(term_lc, [])
+        if search_type in index:
+            return [
+                p
+                for key, plist in index[search_type].items()
+                if term_lc in key
+                for p in plist
+            ]
+        return []
+
+    def _search_done(self, cache_key, results, from_typing: bool):
+        """Store and render a finished background scan."""
+        self._search_cache[cache_key] = results
+        search_type, term_lc = cache_key
+        # The user may have kept typing while the scan ran; only render
+        # if this result still matches the entry contents
+        if (self.search_type.get(), self.search_entry.get().strip().casefold()) != (
+            search_type, term_lc
+        ):
+            return
+        self._render_search_results(cache_key, results, from_typing)
+
+    def _render_search_results(self, cache_key, results, from_typing: bool):
+        tree = self.search_tree
+        # As with the products table, unmap the tree while rows change so
+        # Tk redraws once on repack rather than per insert
+        tree.pack_forget()
+        try:
+            children = tree.get_children()
+            if children:
+                tree.delete(*children)
+            if results:
+                self._rendered_search_key = cache_key
+                for product in results:
+                    tree.insert(
+                        "", "end",
+                        iid=product.sku,
+                        values=(
+                            product.sku,
+                            product.name,
+                            product.category,
+                            product.price_display,
+                            product.quantity,
+                            product.supplier_display
+                        )
                     )
-                    label.grid(row=row, column=col, padx=2, pady=2, sticky="ew")
-                    row_widgets.append(label)
-                
-                self.search_rows.append(row_widgets)
-        else:
-            messagebox.showinfo("Search Results", "No products found matching your search.")
+            else:
+                self._rendered_search_key = None
+        finally:
+            tree.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        if not results and not from_typing:
+            self._flash_status("No products found matching your search.")
     
     def generate_report(self):
-        """Generate and display inventory report."""
-        report = self.manager.generate_inventory_report()
+        """Generate and display the inventory report.
+
+        The text is inserted in bounded chunks scheduled with after_idle,
+        so a very large report never stalls the event loop in one giant
+        insert.
+        """
+        version = self.manager.version
+        self._cancel_report_pump()
+        self.report_text.configure(state="normal")
         self.report_text.delete("0.0", "end")
-        self.report_text.insert("0.0", report)
+        
+        if version == self._report_cache[0]:
+            # Unchanged inventory: replay the cached string in chunks
+            report = self._report_cache[1]
+            self._pump_lines(
+                report[i:i + REPORT_CHUNK_SIZE]
+                for i in range(0, len(report), REPORT_CHUNK_SIZE)
+            )
+            return
+        
+        # Stream straight from the report generator; the first lines
+        # appear before the rest of the inventory has been walked. The
+        # wrapper collects the lines so the version cache still fills.
+        def capture(lines):
+            parts = []
+            for line in lines:
+                parts.append(line)
+                yield line + "\n"
+            self._report_cache = (version, "\n".join(parts))
+        
+        self._pump_lines(capture(self.manager.generate_inventory_report_lines()))
+
+    def _cancel_report_pump(self):
+        """Stop any in-flight chunked report render.
+
+        Without this, two pumps triggered back to back would interleave
+        their inserts into the same textbox, and whichever finished
+        first would disable the widget mid-stream, truncating the other.
+        """
+        if self._report_after_id is not None:
+            self.root.after_cancel(self._report_after_id)
+            self._report_after_id = None
+
+    def _pump_lines(self, pieces):
+        """Insert the next batch of text pieces, rescheduling until done."""
+        self._report_after_id = None
+        batch = list(islice(pieces, REPORT_LINES_PER_TICK))
+        if not batch:
+            self.report_text.configure(state="disabled")
+            return
+        self.report_text.insert("end", "".join(batch))
+        self._report_after_id = self.root.after_idle(self._pump_lines, pieces)
+
+    def _set_report_text(self, text: str):
+        """Replace the report textbox contents in one enable/write/disable pass.
+
+        Keeping the widget disabled between writes means Tk treats it as
+        display-only and the delete/insert pair is the only redraw work.
+        """
+        box = self.report_text
+        box.configure(state="normal")
+        box.delete("0.0", "end")
+        box.insert("0.0", text)
+        box.configure(state="disabled")
     
     def show_low_stock_in_report(self):
-        """Show low stock items in the report tab."""
-        low_stock = self.manager.get_low_stock_products()
-        
-        self.report_text.delete("0.0", "end")
+        """Show low stock items in the report tab, streamed in batches."""
+        self._cancel_report_pump()
+        low_stock = self._low_stock()
         
         if not low_stock:
-            self.report_text.insert("0.0", "No products are low on stock.")
-        else:
-            report_lines = [
-                "=" * 60,
-                "LOW STOCK REPORT",
-                "=" * 60,
-                "",
-                f"Total Low Stock Items: {len(low_stock)}",
-                "",
-                "-" * 60
-            ]
-            
+            self._set_report_text("No products are low on stock.")
+            return
+        
+        def lines():
+            yield "=" * 60
+            yield "LOW STOCK REPORT"
+            yield "=" * 60
+            yield ""
+            yield f"Total Low Stock Items: {len(low_stock)}"
+            yield ""
+            yield "-" * 60
             for product in low_stock:
-                report_lines.append(f"SKU:      {product.sku}")
-                report_lines.append(f"Name:     {product.name}")
-                report_lines.append(f"Quantity: {product.quantity} (Reorder at {product.reorder_level})")
-                report_lines.append(f"Supplier: {product.supplier or 'N/A'}")
-                report_lines.append("-" * 60)
-            
-            self.report_text.insert("0.0", "\n".join(report_lines))
+                yield f"SKU:      {product.sku}"
+                yield f"Name:     {product.name}"
+                yield f"Quantity: {product.quantity} (Reorder at {product.reorder_level})"
+                yield f"Supplier: {product.supplier_display}"
+                yield "-" * 60
+        
+        self.report_text.configure(state="normal")
+        self.report_text.delete("0.0", "end")
+        self._pump_lines(line + "\n" for line in lines())
     
     def show_low_stock(self):
-        """Show low stock items in a popup."""
-        low_stock = self.manager.get_low_stock_products()
+        """Show all low stock items in a reusable Toplevel table.
+
+        Unlike the old messagebox, which truncated after ten items, the
+        Treeview lists every low-stock product and scrolls; rendering is
+        one C-side insert per row with no string assembly.
+        """
+        low_stock = self._low_stock()
         
         if not low_stock:
             messagebox.showinfo("Low Stock", "No products are low on stock.")
-        else:
-            message = f"Found {len(low_stock)} low stock item(s):\n\n"
-            for product in low_stock[:MAX_LOW_STOCK_DISPLAY]:
-                message += f"• {product.name} (SKU: {product.sku}): {product.quantity} units\n"
-            
-            if len(low_stock) > MAX_LOW_STOCK_DISPLAY:
-                message += f"\n... and {len(low_stock) - MAX_LOW_STOCK_DISPLAY} more"
-            
-            messagebox.showwarning("Low Stock Alert", message)
+            return
+        
+        if self._low_stock_dialog is None:
+            self._build_low_stock_dialog()
+        
+        tree = self.low_stock_tree
+        children = tree.get_children()
+        if children:
+            tree.delete(*children)
+        for product in low_stock:
+            tree.insert(
+                "", "end",
+                iid=product.sku,
+                values=(
+                    product.sku,
+                    product.name,
+                    product.quantity,
+                    product.reorder_level,
+                    product.supplier_display
+                )
+            )
+        
+        self._low_stock_dialog.title(f"Low Stock Alert - {len(low_stock)} item(s)")
+        self._low_stock_dialog.deiconify()
+        self._low_stock_dialog.lift()
+
+    def _build_low_stock_dialog(self):
+        """Construct the low-stock Toplevel and its table once."""
+        dialog = ctk.CTkToplevel(self.root)
+        dialog.geometry("600x400")
+        dialog.configure(fg_color=self.bg_dark)
+        dialog.withdraw()
+        dialog.protocol("WM_DELETE_WINDOW", dialog.withdraw)
+        
+        self.low_stock_tree = self._make_tree(dialog, LOW_STOCK_COLUMNS)
+        
+        scrollbar = ttk.Scrollbar(
+            dialog, orient="vertical", command=self.low_stock_tree.yview
+        )
+        self.low_stock_tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        self.low_stock_tree.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        self._low_stock_dialog = dialog
     
     def backup_data(self):
-        """Create a backup of inventory data."""
-        success, message = self.manager.backup()
+        """Create a backup of inventory data on the worker thread.
+
+        Running it on the same single-worker executor as the saves keeps
+        the Tk loop free during the file copy and serializes the backup
+        against any in-flight save without extra locking.
+        """
+        future = self._save_executor.submit(self.manager.backup)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._backup_done, f.result())
+        )
+
+    def _backup_done(self, result):
+        """Report the backup outcome back on the Tk thread."""
+        success, message = result
         if success:
-            messagebox.showinfo("Backup", message)
+            self._flash_status(message)
         else:
             messagebox.showerror("Backup Error", message)
     
     def refresh_all(self):
-        """Refresh all views."""
-        self.refresh_products_list()
-        messagebox.showinfo("Refresh", "All views refreshed!")
+        """Refresh the product table if anything changed since last time."""
+        if self.manager.version == self._last_refresh_version:
+            self._flash_status("Already up to date")
+            return
+        self._schedule_refresh()
+        self._flash_status(f"Refreshed at {datetime.now().strftime('%H:%M:%S')}")
     
     def show_about(self):
         """Show about dialog."""
-        from datetime import datetime
-        current_year = datetime.now().year
-        
-        about_text = f"""
-Inventory Management System
-Version 1.0
-
-A comprehensive inventory management application
-with CLI and GUI interfaces.
-
-Features:
-• Product Management (CRUD operations)
-• Stock Tracking
-• Search & Filter
-• Low Stock Alerts
-• Inventory Reports
-• Data Backup
-
-© {current_year} - Cost & Management Accounting Course
-"""
-        messagebox.showinfo("About", about_text)
+        messagebox.showinfo("About", _ABOUT_TEXT)
     
+    def _on_exit(self):
+        """Flush any pending save before closing the window."""
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+            self._flush_save()
+        self._search_executor.shutdown(wait=False)
+        self._save_executor.shutdown(wait=True)
+        self.root.quit()
+
     def run(self):
         """Start the GUI application."""
         self.root.mainloop()
+        # The window may have been closed without going through the Exit
+        # button; flush any save still sitting in its coalesce window
+        if self._save_after_id is not None:
+            self._flush_save()
+        self._search_executor.shutdown(wait=False)
+        self._save_executor.shutdown(wait=True)
 
 
 def main():
@@ -2,10 +2,16 @@
 Core inventory management functionality.
 """
 
+import sys
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from .models import Product
-from .storage import InventoryStorage
+from .storage import InventoryStorage, _canonical_sku
+
+
+def _trigrams(text: str) -> set:
+    """The set of 3-character windows of an (already casefolded) string."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
 
 
 class InventoryManager:
@@ -14,15 +20,83 @@ class InventoryManager:
     stock management, and reporting capabilities.
     """
     
-    def __init__(self, storage_path: str = "inventory_data.json"):
+    def __init__(
+        self,
+        storage_path: str = "inventory_data.json",
+        storage: Optional[InventoryStorage] = None
+    ):
         """
         Initialize the inventory manager.
         
         Args:
             storage_path: Path to the JSON file for data persistence
+            storage: Pre-built storage backend; overrides storage_path
+                when given (lets tests inject an in-memory store)
         """
-        self.storage = InventoryStorage(storage_path)
+        self.storage = storage if storage is not None else InventoryStorage(storage_path)
         self.products: Dict[str, Product] = self.storage.load()
+        # When False, mutations skip the per-operation write; callers are
+        # expected to call save() once at the end of the batch.
+        self.autosave = True
+        # True while in-memory state is ahead of the file; flush() writes
+        # only when this is set
+        self._dirty = False
+        # Nesting depth of `with manager:` blocks; writes are deferred
+        # until the outermost block exits
+        self._batch_depth = 0
+        # Sorted category list, computed lazily and invalidated on mutation
+        self._categories_cache: Optional[List[str]] = None
+        # SKUs at or below their reorder level, maintained incrementally
+        # so low-stock queries do not rescan the whole catalog
+        self._low_stock = set()
+        # SKUs with zero quantity, maintained the same way
+        self._out_of_stock = set()
+        # Bumped on every successful mutation; callers can key caches on
+        # it to detect whether derived data is still current
+        self._version = 0
+        # Counter behind generated SKUs, seeded past any counter-shaped
+        # SKUs already on disk so new assignments never collide
+        self._sku_counter = 0
+        # SKU assigned by the most recent successful add_product, so
+        # callers can recover a generated SKU without parsing the
+        # human-readable return message
+        self.last_added_sku: Optional[str] = None
+        # Inverted indexes keyed by lowercased field value, maintained
+        # incrementally so the search_by_* methods scan distinct values
+        # instead of every product
+        self._by_name: Dict[str, List[Product]] = {}
+        self._by_category: Dict[str, List[Product]] = {}
+        self._by_supplier: Dict[str, List[Product]] = {}
+        # Trigram index over the distinct name keys, so name search
+        # intersects a few small sets instead of substring-scanning
+        # every key
+        self._name_trigrams: Dict[str, set] = {}
+        # Running aggregates for the report getters, adjusted on every
+        # mutation so no report has to rescan the catalog
+        self._total_value = 0.0
+        self._total_stock = 0
+        self._category_value: Dict[str, float] = {}
+        self._category_count: Dict[str, int] = {}
+        # All side structures are seeded in one pass over the loaded
+        # products rather than one iteration per structure
+        for sku, product in self.products.items():
+            if product.is_low_stock():
+                self._low_stock.add(sku)
+            if product.quantity == 0:
+                self._out_of_stock.add(sku)
+            if len(sku) == 8 and sku[0] == "P":
+                try:
+                    self._sku_counter = max(self._sku_counter, int(sku[1:], 16))
+                except ValueError:
+                    pass
+            self._index_add(product)
+            self._aggregate_add(product)
+        # Field-name dispatch for the generic search() entry point
+        self._search_dispatch = {
+            "name": self.search_by_name,
+            "category": self.search_by_category,
+            "supplier": self.search_by_supplier,
+        }
     
     # ==================== CRUD Operations ====================
     
@@ -54,13 +128,22 @@ class InventoryManager:
                 supplier=supplier
             )
             
-            # Override SKU if provided
+            # Override SKU if provided, otherwise assign from the counter
             if sku:
+                sku = _canonical_sku(sku)
                 if sku in self.products:
                     return False, f"Product with SKU '{sku}' already exists"
                 product.sku = sku
+            else:
+                product.sku = self._next_sku()
             
             self.products[product.sku] = product
+            self._categories_cache = None
+            self._track_low_stock(product)
+            self._index_add(product)
+            self._aggregate_add(product)
+            self._version += 1
+            self.last_added_sku = product.sku
             self._save()
             return True, f"Product '{name}' added with SKU: {product.sku}"
             
@@ -84,43 +167,61 @@ class InventoryManager:
         Returns:
             Tuple of (success: bool, message: str)
         """
-        if sku not in self.products:
+        sku = _canonical_sku(sku)
+        product = self.products.get(sku)
+        if product is None:
             return False, f"Product with SKU '{sku}' not found"
         
-        product = self.products[sku]
-        
-        try:
-            if name is not None:
-                if not name:
-                    return False, "Product name cannot be empty"
-                product.name = name
-            if category is not None:
-                if not category:
-                    return False, "Category cannot be empty"
-                product.category = category
-            if price is not None:
-                if price < 0:
-                    return False, "Price cannot be negative"
-                product.price = price
-            if quantity is not None:
-                if quantity < 0:
-                    return False, "Quantity cannot be negative"
-                product.quantity = quantity
-            if description is not None:
-                product.description = description
-            if reorder_level is not None:
-                if reorder_level < 0:
-                    return False, "Reorder level cannot be negative"
-                product.reorder_level = reorder_level
-            if supplier is not None:
-                product.supplier = supplier
-            
-            product.update_timestamp()
-            self._save()
-            return True, f"Product '{sku}' updated successfully"
-            
-        except ValueError as e:
-            return False, str(e)
+        # Validate every argument before assigning anything: a failure
+        # partway through must leave the product untouched, or the
+        # indexes and aggregates (still filed under the old values)
+        # would silently disagree with the product's fields
+        if name is not None and not name:
+            return False, "Product name cannot be empty"
+        if category is not None and not category:
+            return False, "Category cannot be empty"
+        if price is not None and price < 0:
+            return False, "Price cannot be negative"
+        if quantity is not None and quantity < 0:
+            return False, "Quantity cannot be negative"
+        if reorder_level is not None and reorder_level < 0:
+            return False, "Reorder level cannot be negative"
+
+        old_keys = self._index_keys(product)
+        old_value = product.total_value()
+        old_quantity = product.quantity
+        old_category = product.category
+
+        if name is not None:
+            product.name = name
+        if category is not None:
+            product.category = category
+            self._categories_cache = None
+        if price is not None:
+            product.price = price
+        if quantity is not None:
+            product.quantity = quantity
+        if description is not None:
+            product.description = description
+        if reorder_level is not None:
+            product.reorder_level = reorder_level
+        if supplier is not None:
+            product.supplier = supplier
+        if (name is not None or category is not None
+                or price is not None or supplier is not None):
+            product.refresh_display()
+
+        product.update_timestamp()
+        self._track_low_stock(product)
+        new_keys = self._index_keys(product)
+        if new_keys != old_keys:
+            self._index_discard(product, old_keys)
+            self._index_add(product)
+        self._aggregate_discard(old_value, old_quantity, old_category)
+        self._aggregate_add(product)
+        self._version += 1
+        self._save()
+        return True, f"Product '{sku}' updated successfully"
     
     def delete_product(self, sku: str) -> Tuple[bool, str]:
         """
@@ -129,17 +230,41 @@ class InventoryManager:
         Returns:
             Tuple of (success: bool, message: str)
         """
-        if sku not in self.products:
+        sku = _canonical_sku(sku)
+        product = self.products.pop(sku, None)
+        if product is None:
             return False, f"Product with SKU '{sku}' not found"
         
-        product_name = self.products[sku].name
-        del self.products[sku]
+        product_name = product.name
+        self._categories_cache = None
+        self._low_stock.discard(sku)
+        self._out_of_stock.discard(sku)
+        self._index_discard(product, self._index_keys(product))
+        self._aggregate_discard(product.total_value(), product.quantity, product.category)
+        self._version += 1
         self._save()
         return True, f"Product '{product_name}' (SKU: {sku}) deleted"
     
+    def _unsafe_insert(self, product: Product):
+        """Insert an already-validated product, skipping checks and the save.
+
+        Bulk-seeding hook (used by the tests): the caller guarantees
+        the product is valid and its SKU unused. All side structures
+        are still maintained so queries behave exactly as after
+        add_product.
+        """
+        self.products[product.sku] = product
+        self._categories_cache = None
+        self._track_low_stock(product)
+        self._index_add(product)
+        self._aggregate_add(product)
+        self._version += 1
+
+    normalize_sku = staticmethod(_canonical_sku)
+
     def get_product(self, sku: str) -> Optional[Product]:
         """Get a product by SKU."""
-        return self.products.get(sku)
+        return self.products.get(_canonical_sku(sku))
     
     def get_all_products(self) -> List[Product]:
         """Get all products in the inventory."""
@@ -154,15 +279,28 @@ class InventoryManager:
         Returns:
             Tuple of (success: bool, message: str)
         """
-        if sku not in self.products:
+        sku = _canonical_sku(sku)
+        product = self.products.get(sku)
+        if product is None:
             return False, f"Product with SKU '{sku}' not found"
-        
+
+        return self.add_stock_to(product, quantity)
+
+    def add_stock_to(self, product: Product, quantity: int) -> Tuple[bool, str]:
+        """
+        Add stock to an already-fetched product, skipping the SKU lookup.
+
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
         if quantity <= 0:
             return False, "Quantity to add must be positive"
-        
-        product = self.products[sku]
+
         product.quantity += quantity
         product.update_timestamp()
+        self._track_low_stock(product)
+        self._aggregate_stock_delta(product, quantity)
+        self._version += 1
         self._save()
         return True, f"Added {quantity} units to '{product.name}'. New quantity: {product.quantity}"
     
@@ -173,126 +311,347 @@ class InventoryManager:
         Returns:
             Tuple of (success: bool, message: str)
         """
-        if sku not in self.products:
+        sku = _canonical_sku(sku)
+        product = self.products.get(sku)
+        if product is None:
             return False, f"Product with SKU '{sku}' not found"
-        
+
+        return self.remove_stock_from(product, quantity)
+
+    def remove_stock_from(self, product: Product, quantity: int) -> Tuple[bool, str]:
+        """
+        Remove stock from an already-fetched product, skipping the SKU lookup.
+
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
         if quantity <= 0:
             return False, "Quantity to remove must be positive"
-        
-        product = self.products[sku]
-        
+
         if quantity > product.quantity:
             return False, f"Insufficient stock. Available: {product.quantity}, Requested: {quantity}"
-        
+
         product.quantity -= quantity
         product.update_timestamp()
+        self._track_low_stock(product)
+        self._aggregate_stock_delta(product, -quantity)
+        self._version += 1
         self._save()
         return True, f"Removed {quantity} units from '{product.name}'. Remaining: {product.quantity}"
     
     # ==================== Search & Filter ====================
     
     def search_by_name(self, query: str) -> List[Product]:
-        """Search products by name (case-insensitive partial match)."""
-        query_lower = query.lower()
-        return [p for p in self.products.values() if query_lower in p.name.lower()]
+        """Search products by name (case-insensitive partial match).
+
+        Queries of three or more characters intersect the trigram
+        index's posting sets and only substring-check the surviving
+        candidates; shorter queries fall back to scanning the distinct
+        name keys.
+        """
+        query_lower = query.casefold()
+        if len(query_lower) >= 3:
+            candidates = None
+            for tri in _trigrams(query_lower):
+                keys = self._name_trigrams.get(tri)
+                if not keys:
+                    return []
+                candidates = set(keys) if candidates is None else candidates & keys
+                if not candidates:
+                    return []
+            return [
+                p
+                for key in candidates
+                # A trigram hit can still be a false positive
+                if query_lower in key
+                for p in self._by_name[key]
+            ]
+        return [
+            p
+            for key, bucket in self._by_name.items()
+            if query_lower in key
+            for p in bucket
+        ]
     
     def search_by_category(self, category: str) -> List[Product]:
         """Filter products by category (case-insensitive)."""
-        category_lower = category.lower()
-        return [p for p in self.products.values() if p.category.lower() == category_lower]
+        return list(self._by_category.get(category.casefold(), []))
     
     def search_by_supplier(self, supplier: str) -> List[Product]:
         """Filter products by supplier (case-insensitive partial match)."""
-        supplier_lower = supplier.lower()
-        return [p for p in self.products.values() if supplier_lower in p.supplier.lower()]
+        supplier_lower = supplier.casefold()
+        return [
+            p
+            for key, bucket in self._by_supplier.items()
+            if supplier_lower in key
+            for p in bucket
+        ]
+    
+    @property
+    def version(self) -> int:
+        """Monotonic counter bumped on every successful mutation."""
+        return self._version
+
+    @property
+    def low_stock_skus(self) -> set:
+        """SKUs currently at or below their reorder level."""
+        return self._low_stock
+
+    def search(self, field: str, term: str) -> List[Product]:
+        """Dispatch a search to the indexed handler for the given field.
+
+        Accepts "name", "category", or "supplier"; unknown fields return
+        an empty list.
+        """
+        handler = self._search_dispatch.get(field)
+        return handler(term) if handler else []
+
+    def query(
+        self,
+        name: Optional[str] = None,
+        category: Optional[str] = None,
+        supplier: Optional[str] = None,
+        low_stock: Optional[bool] = None
+    ) -> List[Product]:
+        """Filter products on several fields in a single pass.
+
+        The narrowest indexed condition seeds the candidate set — the
+        exact category bucket when a category is given, otherwise the
+        trigram-backed name search — and the remaining conditions are
+        checked per candidate, so a compound query never scans the
+        catalog once per field.
+        """
+        if category is not None:
+            candidates = self._by_category.get(category.casefold(), [])
+        elif name is not None:
+            candidates, name = self.search_by_name(name), None
+        else:
+            candidates = self.products.values()
+        
+        name_cf = name.casefold() if name is not None else None
+        supplier_cf = supplier.casefold() if supplier is not None else None
+        results = []
+        for product in candidates:
+            if name_cf is not None and name_cf not in product.name.casefold():
+                continue
+            if supplier_cf is not None and supplier_cf not in product.supplier.casefold():
+                continue
+            if low_stock is not None and product.is_low_stock() != low_stock:
+                continue
+            results.append(product)
+        return results
     
     def get_low_stock_products(self) -> List[Product]:
         """Get all products that are at or below their reorder level."""
-        return [p for p in self.products.values() if p.is_low_stock()]
+        return [self.products[sku] for sku in sorted(self._low_stock)]
     
     def get_out_of_stock_products(self) -> List[Product]:
         """Get all products with zero quantity."""
-        return [p for p in self.products.values() if p.quantity == 0]
+        return [self.products[sku] for sku in sorted(self._out_of_stock)]
     
     def get_categories(self) -> List[str]:
-        """Get a list of all unique categories."""
-        return sorted(set(p.category for p in self.products.values()))
+        """Get a list of all unique categories (cached between mutations)."""
+        if self._categories_cache is None:
+            # The aggregate buckets already hold exactly the live
+            # categories, so a rebuild sorts those instead of scanning
+            # every product
+            self._categories_cache = sorted(self._category_count)
+        return self._categories_cache
     
     # ==================== Reports ====================
     
     def get_total_inventory_value(self) -> float:
-        """Calculate the total value of all inventory."""
-        return sum(p.total_value() for p in self.products.values())
+        """Get the total value of all inventory (maintained incrementally)."""
+        return self._total_value
     
     def get_inventory_value_by_category(self) -> Dict[str, float]:
-        """Calculate inventory value grouped by category."""
-        values: Dict[str, float] = {}
-        for product in self.products.values():
-            if product.category not in values:
-                values[product.category] = 0
-            values[product.category] += product.total_value()
-        return values
+        """Get inventory value grouped by category (maintained incrementally)."""
+        return dict(self._category_value)
     
     def get_product_count(self) -> int:
         """Get the total number of products in inventory."""
         return len(self.products)
     
     def get_total_stock_count(self) -> int:
-        """Get the total quantity of all items in stock."""
-        return sum(p.quantity for p in self.products.values())
+        """Get the total quantity of all items in stock (maintained incrementally)."""
+        return self._total_stock
     
-    def generate_inventory_report(self) -> str:
-        """Generate a comprehensive inventory report."""
-        report_lines = [
-            "=" * 60,
-            "INVENTORY REPORT",
-            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "=" * 60,
-            "",
-            f"Total Products: {self.get_product_count()}",
-            f"Total Stock Count: {self.get_total_stock_count()} units",
-            f"Total Inventory Value: ${self.get_total_inventory_value():.2f}",
-            "",
-            "--- Value by Category ---"
-        ]
-        
+    def generate_inventory_report_lines(self):
+        """Yield the inventory report line by line.
+
+        Callers that stream to an output sink can consume this directly
+        without materializing the whole report string first.
+        """
+        yield "=" * 60
+        yield "INVENTORY REPORT"
+        yield f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        yield "=" * 60
+        yield ""
+        yield f"Total Products: {self.get_product_count()}"
+        yield f"Total Stock Count: {self.get_total_stock_count()} units"
+        yield f"Total Inventory Value: ${self.get_total_inventory_value():.2f}"
+        yield ""
+        yield "--- Value by Category ---"
+
         category_values = self.get_inventory_value_by_category()
         for category, value in sorted(category_values.items()):
-            report_lines.append(f"  {category}: ${value:.2f}")
-        
+            yield f"  {category}: ${value:.2f}"
+
         low_stock = self.get_low_stock_products()
         if low_stock:
-            report_lines.extend([
-                "",
-                "--- Low Stock Alert ---",
-                f"  {len(low_stock)} product(s) at or below reorder level:"
-            ])
+            yield ""
+            yield "--- Low Stock Alert ---"
+            yield f"  {len(low_stock)} product(s) at or below reorder level:"
             for product in low_stock:
-                report_lines.append(
+                yield (
                     f"    - {product.name} (SKU: {product.sku}): "
                     f"{product.quantity} units (reorder at {product.reorder_level})"
                 )
-        
+
         out_of_stock = self.get_out_of_stock_products()
         if out_of_stock:
-            report_lines.extend([
-                "",
-                "--- Out of Stock ---",
-                f"  {len(out_of_stock)} product(s) out of stock:"
-            ])
+            yield ""
+            yield "--- Out of Stock ---"
+            yield f"  {len(out_of_stock)} product(s) out of stock:"
             for product in out_of_stock:
-                report_lines.append(f"    - {product.name} (SKU: {product.sku})")
-        
-        report_lines.append("")
-        report_lines.append("=" * 60)
-        
-        return "\n".join(report_lines)
+                yield f"    - {product.name} (SKU: {product.sku})"
+
+        yield ""
+        yield "=" * 60
+
+    def generate_inventory_report(self) -> str:
+        """Generate a comprehensive inventory report."""
+        return "\n".join(self.generate_inventory_report_lines())
     
     # ==================== Utility ====================
     
+    def _index_add(self, product: Product):
+        """Insert a product into the inverted field indexes."""
+        name_key = product.name.casefold()
+        bucket = self._by_name.get(name_key)
+        if bucket is None:
+            bucket = self._by_name[name_key] = []
+            for tri in _trigrams(name_key):
+                self._name_trigrams.setdefault(tri, set()).add(name_key)
+        bucket.append(product)
+        self._by_category.setdefault(product.category.casefold(), []).append(product)
+        self._by_supplier.setdefault(product.supplier.casefold(), []).append(product)
+
+    def _index_discard(self, product: Product, keys: Tuple[str, str, str]):
+        """Remove a product from the inverted indexes under the given keys."""
+        for index, key in zip((self._by_name, self._by_category, self._by_supplier), keys):
+            bucket = index.get(key)
+            if bucket is not None:
+                try:
+                    bucket.remove(product)
+                except ValueError:
+                    pass
+                if not bucket:
+                    del index[key]
+                    if index is self._by_name:
+                        for tri in _trigrams(key):
+                            tri_keys = self._name_trigrams.get(tri)
+                            if tri_keys is not None:
+                                tri_keys.discard(key)
+                                if not tri_keys:
+                                    del self._name_trigrams[tri]
+
+    def _index_keys(self, product: Product) -> Tuple[str, str, str]:
+        """The lowercased index keys a product is filed under."""
+        return (product.name.casefold(), product.category.casefold(), product.supplier.casefold())
+
+    def _next_sku(self) -> str:
+        """Return a fresh counter-based SKU.
+
+        A monotonic counter cannot collide the way a truncated uuid4
+        can, and skips the per-add entropy read; user-supplied SKUs
+        that happen to sit on the counter's range are stepped over.
+        """
+        self._sku_counter += 1
+        sku = f"P{self._sku_counter:07X}"
+        while sku in self.products:
+            self._sku_counter += 1
+            sku = f"P{self._sku_counter:07X}"
+        return sys.intern(sku)
+
+    def _aggregate_add(self, product: Product):
+        """Fold a product into the running report aggregates."""
+        value = product.total_value()
+        category = product.category
+        self._total_value += value
+        self._total_stock += product.quantity
+        self._category_value[category] = self._category_value.get(category, 0.0) + value
+        self._category_count[category] = self._category_count.get(category, 0) + 1
+
+    def _aggregate_discard(self, value: float, quantity: int, category: str):
+        """Remove one product's old contribution from the aggregates."""
+        self._total_value -= value
+        self._total_stock -= quantity
+        count = self._category_count[category] - 1
+        if count:
+            self._category_count[category] = count
+            self._category_value[category] -= value
+        else:
+            # Last product in the category: drop the bucket entirely so
+            # float residue never lingers as a phantom category
+            del self._category_count[category]
+            del self._category_value[category]
+
+    def _aggregate_stock_delta(self, product: Product, delta: int):
+        """Adjust the aggregates for a stock change of `delta` units."""
+        self._total_stock += delta
+        value_delta = product.price * delta
+        self._total_value += value_delta
+        self._category_value[product.category] += value_delta
+
+    def _track_low_stock(self, product: Product):
+        """Keep the low-stock set in sync after a stock or threshold change."""
+        if product.quantity <= product.reorder_level:
+            self._low_stock.add(product.sku)
+        else:
+            self._low_stock.discard(product.sku)
+        if product.quantity == 0:
+            self._out_of_stock.add(product.sku)
+        else:
+            self._out_of_stock.discard(product.sku)
+
     def _save(self):
-        """Save the current inventory state to storage."""
-        self.storage.save(self.products)
+        """Mark the inventory dirty and write it out unless batching.
+
+        Inside a `with manager:` block (or with autosave off) the write
+        is deferred, so a bulk run of mutations costs one file rewrite
+        instead of one per operation.
+        """
+        self._dirty = True
+        if self.autosave and self._batch_depth == 0:
+            self.flush()
+
+    def flush(self) -> bool:
+        """Write to storage if anything changed since the last write."""
+        if not self._dirty:
+            return True
+        if self.storage.save(self.products):
+            self._dirty = False
+            return True
+        return False
+
+    def __enter__(self) -> "InventoryManager":
+        """Start a batch: mutations inside the block defer their writes."""
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.flush()
+        return False
+
+    def save(self) -> bool:
+        """Save the current inventory state to storage unconditionally."""
+        if self.storage.save(self.products):
+            self._dirty = False
+            return True
+        return False
     
     def backup(self) -> Tuple[bool, str]:
         """Create a backup of the inventory data."""
@@ -303,5 +662,17 @@ class InventoryManager:
     def clear_all(self) -> Tuple[bool, str]:
         """Clear all products from inventory (use with caution!)."""
         self.products.clear()
+        self._categories_cache = None
+        self._low_stock.clear()
+        self._out_of_stock.clear()
+        self._by_name.clear()
+        self._by_category.clear()
+        self._by_supplier.clear()
+        self._name_trigrams.clear()
+        self._total_value = 0.0
+        self._total_stock = 0
+        self._category_value.clear()
+        self._category_count.clear()
+        self._version += 1
         self._save()
         return True, "All products have been removed from inventory"
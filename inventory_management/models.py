@@ -2,13 +2,30 @@
 Product model for the inventory management system.
 """
 
+import time
+import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
-import uuid
+
+# Timestamps are cached for a short window so bulk mutations reuse one
+# formatted string instead of paying datetime.now().isoformat() per call
+_TS_WINDOW = 0.05
+_last_ts_time = 0.0
+_last_ts = ""
 
 
-@dataclass
+def _now_iso() -> str:
+    """Return the current ISO timestamp, cached for a 50 ms window."""
+    global _last_ts_time, _last_ts
+    now = time.monotonic()
+    if now - _last_ts_time > _TS_WINDOW:
+        _last_ts = datetime.now().isoformat()
+        _last_ts_time = now
+    return _last_ts
+
+
+@dataclass(slots=True)
 class Product:
     """Represents a product in the inventory."""
     
@@ -20,8 +37,15 @@ class Product:
     description: str = ""
     reorder_level: int = 10
     supplier: str = ""
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=_now_iso)
+    updated_at: str = field(default_factory=_now_iso)
+    # Display caches filled by refresh_display; slots keep instances
+    # compact and attribute reads cheap in the table render loops
+    display_name: str = field(init=False, repr=False, compare=False)
+    display_category: str = field(init=False, repr=False, compare=False)
+    price_display: str = field(init=False, repr=False, compare=False)
+    supplier_display: str = field(init=False, repr=False, compare=False)
+    _row_cache: Optional[tuple] = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate product data after initialization."""
@@ -35,7 +59,20 @@ class Product:
             raise ValueError("Product name cannot be empty")
         if not self.category:
             raise ValueError("Category cannot be empty")
-    
+        self.refresh_display()
+
+    def refresh_display(self):
+        """Cache the display forms the table renderers re-read per row.
+
+        Computing these once here (and again after an edit) avoids the
+        string allocations otherwise repeated on every render.
+        """
+        self.display_name = self.name[:24]
+        self.display_category = self.category[:14]
+        self.price_display = f"${self.price:.2f}"
+        self.supplier_display = self.supplier or "N/A"
+        self._row_cache = None
+
     def to_dict(self) -> dict:
         """Convert product to dictionary for serialization."""
         return {
@@ -77,4 +114,29 @@ class Product:
     
     def update_timestamp(self):
         """Update the updated_at timestamp."""
-        self.updated_at = datetime.now().isoformat()
+        self.updated_at = _now_iso()
+        self._row_cache = None
+
+    def cached_row(self) -> tuple:
+        """Return (table cell values, low-stock flag) for this product.
+
+        Computed once and reused across table repaints; any mutation
+        clears it via update_timestamp or refresh_display.
+        """
+        row = self._row_cache
+        if row is None:
+            low = self.is_low_stock()
+            row = (
+                (
+                    self.sku,
+                    self.name,
+                    self.category,
+                    self.price_display,
+                    self.quantity,
+                    f"${self.total_value():.2f}",
+                    "LOW" if low else "OK"
+                ),
+                low
+            )
+            self._row_cache = row
+        return row
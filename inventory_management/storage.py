@@ -4,16 +4,59 @@ Storage module for persisting inventory data to JSON files.
 
 import json
 import os
+import pickle
+import shutil
+import sys
 from typing import Dict, List, Optional
 from .models import Product
 
+try:
+    # C-backed serializer; save/load fall back to the stdlib without it
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _encode_product(obj):
+    """default= hook serializing Products as they are encountered.
+
+    Handing the encoder the Product objects themselves keeps each
+    row dict transient instead of materializing all of them up front.
+    """
+    if isinstance(obj, Product):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _canonical_sku(sku: str) -> str:
+    """Normalize a SKU to its canonical stored form.
+
+    Stored keys are stripped, uppercase and interned. Canonicalizing at
+    parse time means records from legacy files (which kept custom SKUs
+    verbatim, including lowercase ones) land under keys the manager's
+    uppercase lookups actually hit, and interning lets those lookups
+    short-circuit on identity.
+    """
+    return sys.intern(sku.strip().upper())
+
 
 class InventoryStorage:
     """Handles reading and writing inventory data to JSON files."""
     
-    def __init__(self, filepath: str = "inventory_data.json"):
-        """Initialize the storage with a file path."""
+    def __init__(self, filepath: str = "inventory_data.json", indent: Optional[int] = 2):
+        """Initialize the storage with a file path.
+        
+        Args:
+            filepath: Path to the JSON file
+            indent: Pretty-print indent for the JSON file, or None for
+                the compact form (roughly half the encode time and
+                bytes; used where no human reads the file)
+        """
         self.filepath = filepath
+        self.indent = indent
+        # Binary snapshot written next to the JSON file; load prefers it
+        # when fresh because unpickling skips JSON parsing entirely
+        self.snapshot_path = filepath + ".pkl"
     
     def save(self, products: Dict[str, Product]) -> bool:
         """
@@ -26,11 +69,23 @@ class InventoryStorage:
             True if save was successful, False otherwise
         """
         try:
-            data = {
-                "products": [product.to_dict() for product in products.values()]
-            }
-            with open(self.filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            data = {"products": list(products.values())}
+            # Write to a sibling temp file and rename into place so a
+            # crash mid-write never leaves a truncated inventory file
+            tmp_path = self.filepath + ".tmp"
+            if orjson is not None:
+                option = orjson.OPT_PASSTHROUGH_DATACLASS
+                if self.indent:
+                    option |= orjson.OPT_INDENT_2
+                with open(tmp_path, 'wb') as f:
+                    f.write(orjson.dumps(data, default=_encode_product, option=option))
+            else:
+                separators = None if self.indent else (",", ":")
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, default=_encode_product, indent=self.indent,
+                              separators=separators, ensure_ascii=False)
+            os.replace(tmp_path, self.filepath)
+            self._write_snapshot(products)
             return True
         except (IOError, OSError) as e:
             print(f"Error saving inventory data: {e}")
@@ -46,22 +101,58 @@ class InventoryStorage:
         if not os.path.exists(self.filepath):
             return {}
         
+        products = self._load_snapshot()
+        if products is not None:
+            return products
+        
         try:
             with open(self.filepath, 'r', encoding='utf-8') as f:
                 content = f.read().strip()
                 if not content:
                     return {}
-                data = json.loads(content)
+                data = orjson.loads(content) if orjson is not None else json.loads(content)
             
             products = {}
             for product_data in data.get("products", []):
                 product = Product.from_dict(product_data)
+                product.sku = _canonical_sku(product.sku)
                 products[product.sku] = product
+            # Refresh the snapshot so the next startup takes the fast path
+            self._write_snapshot(products)
             return products
         except (IOError, OSError, json.JSONDecodeError) as e:
             print(f"Error loading inventory data: {e}")
             return {}
     
+    def _write_snapshot(self, products: Dict[str, Product]):
+        """Best-effort write of the binary snapshot next to the JSON file."""
+        try:
+            tmp_path = self.snapshot_path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(products, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.snapshot_path)
+        except (IOError, OSError, pickle.PicklingError):
+            # The JSON file is the source of truth; a failed snapshot
+            # only costs the next startup its fast path
+            pass
+    
+    def _load_snapshot(self) -> Optional[Dict[str, Product]]:
+        """Load the binary snapshot if it is at least as new as the JSON."""
+        try:
+            if os.stat(self.snapshot_path).st_mtime < os.stat(self.filepath).st_mtime:
+                return None
+            with open(self.snapshot_path, 'rb') as f:
+                products = pickle.load(f)
+        except (IOError, OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return None
+        # Re-key as well as re-assign: snapshots written by older
+        # versions may hold verbatim lowercase custom SKUs
+        canonical = {}
+        for product in products.values():
+            product.sku = _canonical_sku(product.sku)
+            canonical[product.sku] = product
+        return canonical
+    
     def backup(self, backup_suffix: str = ".backup") -> bool:
         """
         Create a backup of the inventory file.
@@ -74,13 +165,15 @@ class InventoryStorage:
         """
         if not os.path.exists(self.filepath):
             return False
-        
+
         try:
             backup_path = self.filepath + backup_suffix
-            with open(self.filepath, 'r', encoding='utf-8') as f:
-                data = f.read()
-            with open(backup_path, 'w', encoding='utf-8') as f:
-                f.write(data)
+            tmp_path = backup_path + ".tmp"
+            # copyfile copies in-kernel where the platform supports it,
+            # so the file never round-trips through a Python buffer; the
+            # rename keeps the backup atomic as before
+            shutil.copyfile(self.filepath, tmp_path)
+            os.replace(tmp_path, backup_path)
             return True
         except (IOError, OSError) as e:
             print(f"Error creating backup: {e}")
@@ -0,0 +1,26 @@
+"""
+Shared pytest fixtures for the test suite.
+"""
+
+import os
+import platform
+import tempfile
+
+import pytest
+
+# Route temp files to tmpfs on Linux: the file-backed tests then write
+# to RAM instead of the block device, skipping the disk round-trip
+if platform.system() == "Linux" and os.path.isdir("/dev/shm"):
+    os.environ["TMPDIR"] = "/dev/shm"
+    tempfile.tempdir = "/dev/shm"
+
+
+@pytest.fixture(scope="session")
+def shared_tmp_dir(tmp_path_factory):
+    """One session-scoped directory for all file-backed fixtures.
+
+    A single mkdtemp serves the whole run; per-test files are named
+    after the test node beneath it, and pytest cleans the directory
+    up once at session end instead of per test.
+    """
+    return tmp_path_factory.mktemp("inventory")
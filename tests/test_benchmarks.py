@@ -0,0 +1,61 @@
+"""
+Performance regression benchmarks (requires pytest-benchmark).
+
+Run with `pytest -m benchmark` and compare against a saved baseline:
+
+    pytest -m benchmark --benchmark-autosave
+    pytest -m benchmark --benchmark-compare --benchmark-compare-fail=mean:20%
+
+The whole module is skipped when pytest-benchmark is not installed.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from inventory_management.inventory import InventoryManager
+from inventory_management.models import Product
+
+from tests.test_inventory import FakeStorage
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture(scope="module")
+def big_manager():
+    """A manager holding 10k products, built once per module."""
+    manager = InventoryManager(storage=FakeStorage())
+    for i in range(10_000):
+        manager._unsafe_insert(Product(
+            name=f"Product {i}" if i % 100 else f"Apple iPhone {i}",
+            category=f"Category {i % 20}",
+            price=float(i % 500),
+            quantity=i % 100,
+            sku=f"B{i:07X}"
+        ))
+    return manager
+
+
+def test_from_dict_perf(benchmark):
+    """Guard Product.from_dict against construction-cost regressions."""
+    data = {
+        "name": "Bench Product",
+        "category": "Benchmarks",
+        "price": 1.0,
+        "quantity": 1,
+        "sku": "BENCH001",
+        "description": "",
+        "reorder_level": 1,
+        "supplier": ""
+    }
+
+    product = benchmark(Product.from_dict, data)
+
+    assert product.name == "Bench Product"
+
+
+def test_search_by_name_perf(benchmark, big_manager):
+    """Guard name search against falling back to linear scans."""
+    results = benchmark(big_manager.search_by_name, "Apple iPhone")
+
+    assert len(results) == 100
@@ -2,186 +2,157 @@
 Unit tests for the Product model.
 """
 
-import unittest
-from datetime import datetime
+import functools
+
+import pytest
+
 from inventory_management.models import Product
 
 
-class TestProduct(unittest.TestCase):
-    """Test cases for the Product class."""
-    
-    def test_create_product_valid(self):
-        """Test creating a valid product."""
-        product = Product(
-            name="Test Product",
-            category="Electronics",
-            price=99.99,
-            quantity=50
-        )
-        
-        self.assertEqual(product.name, "Test Product")
-        self.assertEqual(product.category, "Electronics")
-        self.assertEqual(product.price, 99.99)
-        self.assertEqual(product.quantity, 50)
-        self.assertEqual(product.reorder_level, 10)  # default
-        self.assertIsNotNone(product.sku)
-        self.assertIsNotNone(product.created_at)
-    
-    def test_create_product_with_all_fields(self):
-        """Test creating a product with all fields specified."""
-        product = Product(
-            name="Full Product",
-            category="Books",
-            price=29.99,
-            quantity=100,
-            sku="BOOK001",
-            description="A complete product",
-            reorder_level=20,
-            supplier="Test Supplier"
-        )
-        
-        self.assertEqual(product.sku, "BOOK001")
-        self.assertEqual(product.description, "A complete product")
-        self.assertEqual(product.reorder_level, 20)
-        self.assertEqual(product.supplier, "Test Supplier")
-    
-    def test_create_product_negative_price(self):
-        """Test that negative price raises ValueError."""
-        with self.assertRaises(ValueError) as context:
-            Product(
-                name="Test",
-                category="Test",
-                price=-10,
-                quantity=5
-            )
-        self.assertIn("Price cannot be negative", str(context.exception))
-    
-    def test_create_product_negative_quantity(self):
-        """Test that negative quantity raises ValueError."""
-        with self.assertRaises(ValueError) as context:
-            Product(
-                name="Test",
-                category="Test",
-                price=10,
-                quantity=-5
-            )
-        self.assertIn("Quantity cannot be negative", str(context.exception))
-    
-    def test_create_product_empty_name(self):
-        """Test that empty name raises ValueError."""
-        with self.assertRaises(ValueError) as context:
-            Product(
-                name="",
-                category="Test",
-                price=10,
-                quantity=5
-            )
-        self.assertIn("Product name cannot be empty", str(context.exception))
-    
-    def test_create_product_empty_category(self):
-        """Test that empty category raises ValueError."""
-        with self.assertRaises(ValueError) as context:
-            Product(
-                name="Test",
-                category="",
-                price=10,
-                quantity=5
-            )
-        self.assertIn("Category cannot be empty", str(context.exception))
-    
-    def test_is_low_stock(self):
-        """Test low stock detection."""
-        product = Product(
-            name="Test",
-            category="Test",
-            price=10,
-            quantity=5,
-            reorder_level=10
-        )
-        self.assertTrue(product.is_low_stock())
-        
-        product.quantity = 15
-        self.assertFalse(product.is_low_stock())
-        
-        product.quantity = 10  # exactly at reorder level
-        self.assertTrue(product.is_low_stock())
-    
-    def test_total_value(self):
-        """Test total value calculation."""
-        product = Product(
-            name="Test",
-            category="Test",
-            price=25.50,
-            quantity=4
-        )
-        self.assertEqual(product.total_value(), 102.00)
-    
-    def test_to_dict(self):
-        """Test conversion to dictionary."""
-        product = Product(
-            name="Dict Test",
-            category="Testing",
-            price=50.00,
-            quantity=10,
-            sku="DICT001"
-        )
-        
-        data = product.to_dict()
-        
-        self.assertEqual(data["name"], "Dict Test")
-        self.assertEqual(data["category"], "Testing")
-        self.assertEqual(data["price"], 50.00)
-        self.assertEqual(data["quantity"], 10)
-        self.assertEqual(data["sku"], "DICT001")
-    
-    def test_from_dict(self):
-        """Test creating product from dictionary."""
-        data = {
-            "name": "From Dict",
-            "category": "Testing",
-            "price": 75.00,
-            "quantity": 25,
-            "sku": "FRMD001",
-            "description": "Created from dict",
-            "reorder_level": 5,
-            "supplier": "Dict Supplier"
-        }
-        
-        product = Product.from_dict(data)
-        
-        self.assertEqual(product.name, "From Dict")
-        self.assertEqual(product.category, "Testing")
-        self.assertEqual(product.price, 75.00)
-        self.assertEqual(product.quantity, 25)
-        self.assertEqual(product.sku, "FRMD001")
-        self.assertEqual(product.description, "Created from dict")
-        self.assertEqual(product.reorder_level, 5)
-        self.assertEqual(product.supplier, "Dict Supplier")
-    
-    def test_roundtrip_dict(self):
-        """Test that to_dict and from_dict are symmetric."""
-        original = Product(
-            name="Roundtrip",
-            category="Testing",
-            price=100.00,
-            quantity=50,
-            description="Roundtrip test",
-            reorder_level=15,
-            supplier="RT Supplier"
-        )
-        
-        data = original.to_dict()
-        restored = Product.from_dict(data)
-        
-        self.assertEqual(original.name, restored.name)
-        self.assertEqual(original.category, restored.category)
-        self.assertEqual(original.price, restored.price)
-        self.assertEqual(original.quantity, restored.quantity)
-        self.assertEqual(original.sku, restored.sku)
-        self.assertEqual(original.description, restored.description)
-        self.assertEqual(original.reorder_level, restored.reorder_level)
-        self.assertEqual(original.supplier, restored.supplier)
-
-
-if __name__ == "__main__":
-    unittest.main()
+@functools.lru_cache(maxsize=None)
+def _cached_product(name, category, price, quantity, sku=None):
+    """Build (or reuse) a Product for tests that never mutate it.
+
+    Caching skips repeated validation, uuid and timestamp work; tests
+    that mutate their product or test construction itself must use the
+    raw constructor.
+    """
+    kwargs = {"sku": sku} if sku is not None else {}
+    return Product(name, category, price, quantity, **kwargs)
+
+
+def test_create_product_valid():
+    """Test creating a valid product."""
+    product = Product(
+        name="Test Product",
+        category="Electronics",
+        price=99.99,
+        quantity=50
+    )
+
+    assert product.name == "Test Product"
+    assert product.category == "Electronics"
+    assert product.price == 99.99
+    assert product.quantity == 50
+    assert product.reorder_level == 10  # default
+    assert product.sku is not None
+    assert product.created_at is not None
+
+
+def test_create_product_with_all_fields():
+    """Test creating a product with all fields specified."""
+    product = Product(
+        name="Full Product",
+        category="Books",
+        price=29.99,
+        quantity=100,
+        sku="BOOK001",
+        description="A complete product",
+        reorder_level=20,
+        supplier="Test Supplier"
+    )
+
+    assert product.sku == "BOOK001"
+    assert product.description == "A complete product"
+    assert product.reorder_level == 20
+    assert product.supplier == "Test Supplier"
+
+
+@pytest.mark.parametrize("kwargs,error", [
+    ({"name": "Test", "category": "Test", "price": -10, "quantity": 5},
+     "Price cannot be negative"),
+    ({"name": "Test", "category": "Test", "price": 10, "quantity": -5},
+     "Quantity cannot be negative"),
+    ({"name": "", "category": "Test", "price": 10, "quantity": 5},
+     "Product name cannot be empty"),
+    ({"name": "Test", "category": "", "price": 10, "quantity": 5},
+     "Category cannot be empty"),
+])
+def test_create_product_invalid(kwargs, error):
+    """Test that invalid construction values raise ValueError."""
+    with pytest.raises(ValueError, match=error):
+        Product(**kwargs)
+
+
+def test_is_low_stock():
+    """Test low stock detection."""
+    product = Product(
+        name="Test",
+        category="Test",
+        price=10,
+        quantity=5,
+        reorder_level=10
+    )
+    assert product.is_low_stock()
+
+    product.quantity = 15
+    assert not product.is_low_stock()
+
+    product.quantity = 10  # exactly at reorder level
+    assert product.is_low_stock()
+
+
+def test_total_value():
+    """Test total value calculation."""
+    product = _cached_product("Test", "Test", 25.50, 4)
+    assert product.total_value() == 102.00
+
+
+def test_to_dict():
+    """Test conversion to dictionary."""
+    product = _cached_product("Dict Test", "Testing", 50.00, 10, sku="DICT001")
+
+    data = product.to_dict()
+
+    assert data["name"] == "Dict Test"
+    assert data["category"] == "Testing"
+    assert data["price"] == 50.00
+    assert data["quantity"] == 10
+    assert data["sku"] == "DICT001"
+
+
+def test_from_dict():
+    """Test creating product from dictionary."""
+    data = {
+        "name": "From Dict",
+        "category": "Testing",
+        "price": 75.00,
+        "quantity": 25,
+        "sku": "FRMD001",
+        "description": "Created from dict",
+        "reorder_level": 5,
+        "supplier": "Dict Supplier"
+    }
+
+    product = Product.from_dict(data)
+
+    assert product.name == "From Dict"
+    assert product.category == "Testing"
+    assert product.price == 75.00
+    assert product.quantity == 25
+    assert product.sku == "FRMD001"
+    assert product.description == "Created from dict"
+    assert product.reorder_level == 5
+    assert product.supplier == "Dict Supplier"
+
+
+# Built once at import; the roundtrip test only reads it
+_BASE_PRODUCT = Product(
+    name="Roundtrip",
+    category="Testing",
+    price=100.00,
+    quantity=50,
+    description="Roundtrip test",
+    reorder_level=15,
+    supplier="RT Supplier"
+)
+
+
+def test_roundtrip_dict():
+    """Test that to_dict and from_dict are symmetric."""
+    data = _BASE_PRODUCT.to_dict()
+    restored = Product.from_dict(data)
+
+    # One whole-dict compare covers every serialized field (Product
+    # is slotted, so the dict forms are the comparable state)
+    assert restored.to_dict() == data